@@ -1,9 +1,18 @@
 import nkeys_fix
+import os
+import re
+import queue
+import atexit
 import logging
 import uvicorn
 import asyncio
-from fastapi import FastAPI, Request, HTTPException, status
-from fastapi.responses import JSONResponse
+import anyio
+import orjson
+from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener
+from fastapi import FastAPI, Request, HTTPException, WebSocket, status
+from fastapi.responses import ORJSONResponse, Response
+from starlette.requests import ClientDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 
 from config.settings import settings
@@ -12,171 +21,120 @@ from .middleware import setup_middleware
 from .db import dynamodb
 from nats_client import nats_manager
 from .websocket import agent_router, dashboard_router
-from api.services.heartbeat_service import heartbeat_service
-from api.services.simple_wildcard_tracker import wildcard_tracker
 
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
+# Configure logging; records are queued and written to stderr by a listener
+# thread so request handlers never wait on the stream
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
+_log_listener = QueueListener(queue.SimpleQueue(), _log_handler)
+_queue_handler = QueueHandler(_log_listener.queue)
+_queue_handler.setFormatter(logging.Formatter("%(message)s"))
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
+# Tenant IDs embedded in NATS subjects are UUIDs
+_UUID_RE = re.compile(r'[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\Z')
+
 # Apply runtime boolean fix for DynamoDB
 try:
     import complete_boolean_fix
     logger.info("Applied complete boolean fix for DynamoDB")
 except Exception as e:
-    logger.warning(f"Could not apply complete boolean fix: {e}")
-
-# Create FastAPI app
-app = FastAPI(
-    title="ArtCafe.ai PubSub API",
-    description="API for ArtCafe.ai PubSub service powering agent communication",
-    version="1.0.0",
-    docs_url="/docs",
-    redoc_url="/redoc",
-    openapi_url="/api/openapi.json",
-    openapi_tags=[
-        {"name": "Authentication", "description": "Authentication endpoints"},
-        {"name": "Agents", "description": "Agent management endpoints"},
-        {"name": "SSH Keys", "description": "SSH key management endpoints"},
-        {"name": "Channels", "description": "Channel management endpoints"},
-        {"name": "Tenant", "description": "Tenant management endpoints"},
-        {"name": "Usage", "description": "Usage metrics and billing endpoints"},
-    ],
-)
-
-# Set up middleware
-setup_middleware(app)
-
-# Include API routes
-app.include_router(router)
-
-# Include WebSocket routes without API prefix for cleaner URLs
-# This makes WebSocket endpoints available at /ws/agent/{agent_id} and /ws/dashboard
-app.include_router(agent_router)
-app.include_router(dashboard_router)
-
-# Add a simple test WebSocket for debugging
-from fastapi import WebSocket
-from fastapi.websockets import WebSocketState
-
-@app.websocket("/ws-test")
-async def test_websocket(websocket: WebSocket):
-    """Simple test WebSocket endpoint"""
-    logger.info("[TEST] WebSocket connection attempt")
-    
-    try:
-        await websocket.accept()
-        logger.info("[TEST] WebSocket accepted")
-        await websocket.send_text("Connected to test WebSocket!")
-        
-        while True:
-            data = await websocket.receive_text()
-            logger.info(f"[TEST] Received: {data}")
-            await websocket.send_text(f"Echo: {data}")
-    except Exception as e:
-        logger.error(f"[TEST] WebSocket error: {e}")
-        if websocket.client_state != WebSocketState.DISCONNECTED:
-            await websocket.close()
-
-
-@app.get("/")
-async def root():
-    """Root endpoint"""
-    return {
-        "service": "ArtCafe.ai PubSub API",
-        "version": "1.0.0",
-        "status": "operational"
-    }
-
-
-@app.get("/health")
-async def health_check():
-    """Health check endpoint"""
-    return {
-        "status": "ok",
-        "nats_connected": nats_manager._client is not None and nats_manager._client.is_connected
-    }
-
-
-@app.exception_handler(Exception)
-async def global_exception_handler(request: Request, exc: Exception):
-    """Global exception handler"""
-    logger.error(f"Global exception: {exc}", exc_info=True)
-    
-    return JSONResponse(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content={"detail": "Internal server error"}
-    )
-
+    logger.warning("Could not apply complete boolean fix: %s", e)
 
-@app.on_event("startup")
-async def startup_event():
-    """Execute on application startup"""
-    logger.info("Starting ArtCafe.ai PubSub API...")
 
-    # Connect to NATS if enabled
+async def _start_messaging():
+    """Connect to NATS, then start the services that depend on it"""
     if settings.NATS_ENABLED:
         try:
             await nats_manager.connect()
             logger.info("Connected to NATS server")
             
             # Start heartbeat service after NATS is connected
-            await heartbeat_service.start()
-            logger.info("Heartbeat service started")
+            if settings.ENABLE_HEARTBEAT_SERVICE:
+                from api.services.heartbeat_service import heartbeat_service
+                await heartbeat_service.start()
+                logger.info("Heartbeat service started")
             
             # Start wildcard message tracker for comprehensive billing
-            await wildcard_tracker.start()
-            logger.info("Wildcard message tracker started")
+            if settings.ENABLE_WILDCARD_TRACKER:
+                from api.services.simple_wildcard_tracker import wildcard_tracker
+                await wildcard_tracker.start()
+                logger.info("Wildcard message tracker started")
         except Exception as e:
-            logger.error(f"Failed to connect to NATS server or start heartbeat service: {e}")
+            logger.error("Failed to connect to NATS server or start heartbeat service: %s", e)
     else:
         logger.info("NATS is disabled, skipping connection")
 
-    # Ensure DynamoDB tables exist
+    # Start channel bridge service (for AWS WebSocket integration)
+    try:
+        from .services.channel_bridge_service import channel_bridge
+        await channel_bridge.start()
+        logger.info("Channel bridge service started")
+    except Exception as e:
+        logger.error("Failed to start channel bridge service: %s", e)
+
+
+async def _warm_connections():
+    """Open the DynamoDB and NATS connections before the first request"""
+    try:
+        await dynamodb._call(dynamodb.client.describe_limits)
+    except Exception as e:
+        logger.warning("Could not pre-warm DynamoDB connection: %s", e)
+
+    try:
+        await nats_manager.flush(timeout=1.0)
+    except Exception as e:
+        logger.warning("Could not pre-warm NATS connection: %s", e)
+
+
+async def _ensure_tables():
+    """Ensure DynamoDB tables exist"""
+    if settings.SKIP_TABLE_CHECK:
+        logger.info("DynamoDB table check skipped")
+        return
     try:
         await dynamodb.ensure_tables_exist()
         logger.info("DynamoDB tables ready")
     except Exception as e:
-        logger.error(f"Failed to ensure DynamoDB tables: {e}")
+        logger.error("Failed to ensure DynamoDB tables: %s", e)
 
-    # Start metrics service
+
+async def _start_metrics():
+    """Start metrics service"""
     try:
         from infrastructure.metrics_service import metrics_service
         await metrics_service.start()
         logger.info("Metrics service started")
     except Exception as e:
-        logger.error(f"Failed to start metrics service: {e}")
+        logger.error("Failed to start metrics service: %s", e)
+
 
-    # Initialize challenge store
+async def _init_challenge_store():
+    """Initialize challenge store"""
     try:
         from infrastructure.challenge_store import challenge_store
         await challenge_store.ensure_table_exists()
         logger.info("Challenge store initialized")
     except Exception as e:
-        logger.error(f"Failed to initialize challenge store: {e}")
-    
-    # Heartbeat checking is now handled internally by the websocket module
-    
-    # Initialize local message tracker (Valkey/Redis)
-    try:
-        from api.services.local_message_tracker import message_tracker
-        message_tracker.connect()
-        logger.info("Local message tracker initialized")
-    
-    except Exception as e:
-        logger.error(f"Failed to initialize message tracker: {e}")
-    
-    # Start local backup service
+        logger.error("Failed to initialize challenge store: %s", e)
+
+
+async def _start_backup():
+    """Start local backup service (Redis to disk), falling back to S3"""
+    if not settings.ENABLE_BACKUP_SERVICE:
+        logger.info("Backup service is disabled, skipping")
+        return
     try:
-        from api.services.local_backup_service import backup_service
+        from api.services.local_backup_service import get_backup_service
+        backup_service = get_backup_service()
         await backup_service.start()
         logger.info("Local backup service started")
     except Exception as e:
-        logger.error(f"Failed to start local backup service: {e}")
+        logger.error("Failed to start local backup service: %s", e)
         # Try S3 backup as fallback
         try:
             from api.services.s3_backup_service import get_s3_backup_service
@@ -184,71 +142,96 @@ async def startup_event():
             await s3_backup_service.start()
             logger.info("S3 backup service started as fallback")
         except Exception as e2:
-            logger.warning(f"S3 backup service also unavailable: {e2}")
+            logger.warning("S3 backup service also unavailable: %s", e2)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run application startup, then shutdown once the server stops"""
+    logger.info("Starting ArtCafe.ai PubSub API...")
+
+    # Raise anyio's default of 40 worker threads so sync dependencies and
+    # run_in_threadpool calls don't queue behind each other under fan-out
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = settings.THREAD_POOL_SIZE or (os.cpu_count() or 1) * 25
+
+    app.state.nats = nats_manager
+    app.state.dynamodb = dynamodb
+
+    # Heartbeat checking is now handled internally by the websocket module
     
-    # Start channel bridge service (for AWS WebSocket integration)
+    # Initialize local message tracker (Valkey/Redis)
     try:
-        from .services.channel_bridge_service import channel_bridge
-        await channel_bridge.start()
-        logger.info("Channel bridge service started")
+        from api.services.local_message_tracker import message_tracker
+        message_tracker.connect()
+        app.state.message_tracker = message_tracker
+        logger.info("Local message tracker initialized")
+    
     except Exception as e:
-        logger.error(f"Failed to start channel bridge service: {e}")
+        logger.error("Failed to initialize message tracker: %s", e)
+
+    # Independent startup steps overlap their network round-trips; each
+    # step logs and swallows its own failure so siblings keep running
+    await asyncio.gather(
+        _start_messaging(),
+        _ensure_tables(),
+        _start_metrics(),
+        _init_challenge_store(),
+        _start_backup(),
+    )
+    await _warm_connections()
 
     logger.info("ArtCafe.ai PubSub API started")
 
 
     # Setup NATS message tracking for direct clients
     try:
-        async def track_nats_msg(msg):
+        async def track_tenant_msg(msg, tenant_id, channel_id=None):
             try:
-                parts = msg.subject.split('.')
-                # Handle both patterns:
-                # 1. tenant.{tenant_id}.> (original pattern)
-                # 2. {tenant_id}.sensors.temperature (cyberforge pattern)
-                # 3. {tenant_id}.alerts.temperature (cyberforge pattern)
-                
-                if parts[0] == 'tenant' and len(parts) > 1:
-                    # Original pattern: tenant.{tenant_id}.>
-                    tenant_id = parts[1]
-                elif len(parts[0]) == 36 and '-' in parts[0]:
-                    # Cyberforge pattern: {tenant_id}.sensors.temperature
-                    tenant_id = parts[0]
-                else:
-                    # Not a tenant message, skip
-                    return
-                
                 # Verify it's a valid UUID format
-                if len(tenant_id) == 36 and tenant_id.count('-') == 4:
-                    # Extract agent_id and channel from subject if possible
-                    agent_id = None
-                    channel_id = None
-                    
-                    # Try to extract channel from subject like "tenant_id.sensors.temperature"
-                    if len(parts) > 1:
-                        channel_id = parts[1] if parts[1] in ['sensors', 'alerts'] else None
-                    
+                if _UUID_RE.match(tenant_id):
+                    size = len(msg.data) if msg.data else 0
                     await message_tracker.track_message(
                         tenant_id=tenant_id,
-                        agent_id=agent_id,
+                        agent_id=None,
                         channel_id=channel_id,
-                        message_size=len(msg.data) if msg.data else 0
+                        message_size=size
                     )
-                    logger.debug(f"Tracked message on subject: {msg.subject}, size: {len(msg.data) if msg.data else 0}")
+                    logger.debug("Tracked message on subject: %s, size: %d", msg.subject, size)
             except Exception as e:
-                logger.debug(f"Error tracking message: {e}")
-        
-        # Subscribe to all messages to catch both patterns
-        await nats_manager.subscribe(">", callback=track_nats_msg)
+                logger.debug("Error tracking message: %s", e)
+
+        # Tenant IDs are fixed-width, so slice them out at known offsets
+        # instead of splitting the whole subject
+        async def track_prefixed_msg(msg):
+            # Original pattern: tenant.{tenant_id}.>
+            subject = msg.subject
+            if subject[43:44] == '.':
+                await track_tenant_msg(msg, subject[7:43])
+
+        async def track_sensors_msg(msg):
+            # Cyberforge pattern: {tenant_id}.sensors.temperature
+            subject = msg.subject
+            if subject[36:37] == '.':
+                await track_tenant_msg(msg, subject[:36], "sensors")
+
+        async def track_alerts_msg(msg):
+            # Cyberforge pattern: {tenant_id}.alerts.temperature
+            subject = msg.subject
+            if subject[36:37] == '.':
+                await track_tenant_msg(msg, subject[:36], "alerts")
+
+        # Subscribe only to tenant subjects so the server filters the rest
+        await nats_manager.subscribe("tenant.*.>", callback=track_prefixed_msg)
+        await nats_manager.subscribe("*.sensors.>", callback=track_sensors_msg)
+        await nats_manager.subscribe("*.alerts.>", callback=track_alerts_msg)
         logger.info("NATS direct message tracking enabled for all tenant patterns")
     except Exception as e:
-        logger.error(f"Failed to setup NATS tracking: {e}")
+        logger.error("Failed to setup NATS tracking: %s", e)
+
+    yield
 
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Execute on application shutdown"""
     logger.info("Shutting down ArtCafe.ai PubSub API...")
-    
-    
 
     # Stop S3 backup service
     try:
@@ -257,7 +240,7 @@ async def shutdown_event():
         await s3_backup_service.stop()
         logger.info("S3 backup service stopped")
     except Exception as e:
-        logger.error(f"Failed to stop S3 backup service: {e}")
+        logger.error("Failed to stop S3 backup service: %s", e)
 
     # Stop metrics service
     try:
@@ -265,7 +248,7 @@ async def shutdown_event():
         await metrics_service.stop()
         logger.info("Metrics service stopped")
     except Exception as e:
-        logger.error(f"Failed to stop metrics service: {e}")
+        logger.error("Failed to stop metrics service: %s", e)
     
     # Stop channel bridge service
     try:
@@ -273,14 +256,16 @@ async def shutdown_event():
         await channel_bridge.stop()
         logger.info("Channel bridge service stopped")
     except Exception as e:
-        logger.error(f"Failed to stop channel bridge service: {e}")
+        logger.error("Failed to stop channel bridge service: %s", e)
     
     # Stop heartbeat service
     try:
-        await heartbeat_service.stop()
-        logger.info("Heartbeat service stopped")
+        if settings.ENABLE_HEARTBEAT_SERVICE:
+            from api.services.heartbeat_service import heartbeat_service
+            await heartbeat_service.stop()
+            logger.info("Heartbeat service stopped")
     except Exception as e:
-        logger.error(f"Failed to stop heartbeat service: {e}")
+        logger.error("Failed to stop heartbeat service: %s", e)
 
     # Close NATS connection
     await nats_manager.close()
@@ -288,11 +273,116 @@ async def shutdown_event():
     logger.info("ArtCafe.ai PubSub API shutdown completed")
 
 
+async def test_websocket(websocket: WebSocket):
+    """Simple test WebSocket endpoint"""
+    logger.info("[TEST] WebSocket connection attempt")
+    
+    await websocket.accept()
+    logger.info("[TEST] WebSocket accepted")
+    await websocket.send_text("Connected to test WebSocket!")
+    
+    # iter_text ends cleanly when the client disconnects
+    async for data in websocket.iter_text():
+        logger.info("[TEST] Received: %s", data)
+        await websocket.send_text(f"Echo: {data}")
+
+
+# Static bodies for the probe endpoints, encoded once at import
+_ROOT_BODY = orjson.dumps({
+    "service": "ArtCafe.ai PubSub API",
+    "version": "1.0.0",
+    "status": "operational"
+})
+_HEALTH_OK = orjson.dumps({"status": "ok", "nats_connected": True})
+_HEALTH_DOWN = orjson.dumps({"status": "ok", "nats_connected": False})
+
+
+async def root():
+    """Root endpoint"""
+    return Response(content=_ROOT_BODY, media_type="application/json")
+
+
+async def health_check():
+    """Health check endpoint"""
+    body = _HEALTH_OK if nats_manager.is_connected else _HEALTH_DOWN
+    return Response(content=body, media_type="application/json")
+
+
+async def client_disconnect_handler(request: Request, exc: ClientDisconnect):
+    """Client went away mid-request; expected, so no traceback"""
+    logger.warning("Client disconnected during %s %s", request.method, request.url.path)
+    return Response(status_code=499)
+
+
+async def global_exception_handler(request: Request, exc: Exception):
+    """Global exception handler for unexpected errors"""
+    logger.exception("Global exception: %s", exc)
+    
+    return ORJSONResponse(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        content={"detail": "Internal server error"}
+    )
+
+
+def create_app() -> FastAPI:
+    """Build the FastAPI application"""
+    app = FastAPI(
+        title="ArtCafe.ai PubSub API",
+        description="API for ArtCafe.ai PubSub service powering agent communication",
+        version="1.0.0",
+        docs_url="/docs",
+        redoc_url="/redoc",
+        openapi_url="/api/openapi.json",
+        openapi_tags=[
+            {"name": "Authentication", "description": "Authentication endpoints"},
+            {"name": "Agents", "description": "Agent management endpoints"},
+            {"name": "SSH Keys", "description": "SSH key management endpoints"},
+            {"name": "Channels", "description": "Channel management endpoints"},
+            {"name": "Tenant", "description": "Tenant management endpoints"},
+            {"name": "Usage", "description": "Usage metrics and billing endpoints"},
+        ],
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse,
+    )
+
+    # Set up middleware
+    setup_middleware(app)
+
+    # Include API routes (registered first: /api/v1 carries most traffic
+    # and Starlette matches routes in order)
+    app.include_router(router)
+
+    # Include WebSocket routes without API prefix for cleaner URLs
+    # This makes WebSocket endpoints available at /ws/agent/{agent_id} and /ws/dashboard
+    app.include_router(agent_router)
+    app.include_router(dashboard_router)
+
+    # Add a simple, unauthenticated test WebSocket in debug builds only
+    if settings.DEBUG:
+        app.add_api_websocket_route("/ws-test", test_websocket)
+
+    app.add_api_route("/", root, methods=["GET"])
+    app.add_api_route("/health", health_check, methods=["GET"])
+
+    app.add_exception_handler(ClientDisconnect, client_disconnect_handler)
+    app.add_exception_handler(Exception, global_exception_handler)
+
+    return app
+
+
+app = create_app()
+
+
 if __name__ == "__main__":
-    # Run with uvicorn
+    # Run with uvicorn (reload and workers are mutually exclusive)
+    workers = None if settings.DEBUG else (settings.WORKERS or max(2, os.cpu_count() or 1))
     uvicorn.run(
         "api.app:app",
         host="0.0.0.0",
         port=8000,
-        reload=settings.DEBUG
+        reload=settings.DEBUG,
+        workers=workers,
+        loop="uvloop",
+        http="httptools",
+        ws="websockets"
     )
\ No newline at end of file
@@ -1,132 +1,653 @@
+import asyncio
+import base64
 import logging
 import boto3
-import json
+import orjson
+import random
+import time
+from botocore.config import Config
 import uuid
-from typing import Any, Dict, List, Optional
-from datetime import datetime, date
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import Any, AsyncIterator, Dict, List, Optional
+from dataclasses import dataclass
+from datetime import datetime, date, timezone
 
 from config.settings import settings
 
+try:
+    from amazondax import AmazonDaxClient
+except ImportError:
+    AmazonDaxClient = None
+
 logger = logging.getLogger(__name__)
 
+# One pooled connection per concurrent request; adaptive retries back off on throttling
+CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    retries={"max_attempts": 3, "mode": "adaptive"},
+    connect_timeout=1,
+    read_timeout=5
+)
+
+# BatchWriteItem/BatchGetItem request limits; unprocessed entries are retried with jittered backoff
+BATCH_WRITE_SIZE = 25
+BATCH_GET_SIZE = 100
+BATCH_MAX_RETRIES = 8
+BATCH_BACKOFF_BASE = 0.05
+BATCH_BACKOFF_CAP = 2.0
+
+# How long a DescribeTable result is reused when reconciling GSIs
+DESCRIBE_CACHE_TTL = 300
+
+# Per-table cap on cached get_item results
+READ_CACHE_MAX_ITEMS = 10000
+
+
+def _now_iso() -> str:
+    """Current UTC time in the naive ISO format stored on every item"""
+    return datetime.now(timezone.utc).replace(tzinfo=None).isoformat()
+
+
+async def _backoff(attempt: int) -> None:
+    """Sleep before retrying a batch request, with jittered exponential backoff"""
+    delay = min(BATCH_BACKOFF_CAP, BATCH_BACKOFF_BASE * 2 ** attempt)
+    await asyncio.sleep(delay / 2 + random.uniform(0, delay / 2))
+
+
+def _encode_token(last_evaluated_key: Dict[str, Any]) -> str:
+    """Encode LastEvaluatedKey as an opaque, URL-safe pagination token"""
+    return base64.urlsafe_b64encode(orjson.dumps(last_evaluated_key)).decode()
+
+
+class InvalidTokenError(ValueError):
+    """Pagination token that wasn't issued by _encode_token"""
+
+
+def _decode_token(token: str) -> Dict[str, Any]:
+    """Decode a pagination token back to ExclusiveStartKey"""
+    try:
+        # Tokens issued before base64 encoding are plain JSON
+        if token.startswith("{"):
+            start_key = orjson.loads(token)
+        else:
+            start_key = orjson.loads(base64.urlsafe_b64decode(token))
+    except ValueError as e:
+        raise InvalidTokenError("Invalid next_token") from e
+    if not isinstance(start_key, dict):
+        raise InvalidTokenError("Invalid next_token")
+    return start_key
+
+
+def _decode_number(raw: str) -> Any:
+    """Convert a DynamoDB number string to int if possible, otherwise float"""
+    try:
+        return int(raw)
+    except ValueError:
+        return float(raw)
+
+
+def _decode_value(value: Dict[str, Any]) -> Any:
+    """Convert a single DynamoDB attribute value to its Python form"""
+    for tag, raw in value.items():
+        decoder = _DECODERS.get(tag)
+        if decoder is not None:
+            return decoder(raw)
+    logger.warning(f"Unknown DynamoDB type: {value}")
+    return str(value)
+
+
+# Type tag -> decoder, so each attribute costs one dict lookup instead of a chain of "in" probes
+_DECODERS = {
+    "S": lambda raw: raw,
+    "N": _decode_number,
+    "BOOL": lambda raw: raw,
+    "NULL": lambda raw: None,
+    "L": lambda raw: [_decode_value(x) for x in raw],
+    "M": lambda raw: {k: _decode_value(v) for k, v in raw.items()},
+    "SS": list,
+    "NS": lambda raw: [_decode_number(x) for x in raw],
+}
+
+
+def _decode_items(items: List[Dict[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """Convert a page of DynamoDB items, inlining the common S and N tags"""
+    decoders = _DECODERS
+    decode_number = _decode_number
+    result = []
+    for item in items:
+        decoded = {}
+        for key, value in item.items():
+            for tag, raw in value.items():
+                if tag == "S":
+                    decoded[key] = raw
+                elif tag == "N":
+                    decoded[key] = decode_number(raw)
+                else:
+                    decoder = decoders.get(tag)
+                    decoded[key] = decoder(raw) if decoder is not None else _decode_value(value)
+                break
+        result.append(decoded)
+    return result
+
+
+# Shared attribute values for constants; botocore only reads them
+_NULL_AV = {"NULL": True}
+_TRUE_AV = {"N": "1"}
+_FALSE_AV = {"N": "0"}
+
+
+def _encode_value(value: Any) -> Dict[str, Any]:
+    """Convert a single Python value to a DynamoDB attribute value"""
+    encoder = _ENCODERS.get(type(value))
+    if encoder is not None:
+        return encoder(value)
+    if isinstance(value, str):
+        return {"S": value}
+    if isinstance(value, (int, float)):
+        return {"N": str(value)}
+    if isinstance(value, (list, tuple)):
+        return _encode_list(value)
+    if isinstance(value, dict):
+        return _encode_map(value)
+    if isinstance(value, (datetime, date)):
+        return {"S": value.isoformat()}
+    # Try to JSON serialize
+    try:
+        return {"S": orjson.dumps(value).decode()}
+    except TypeError:
+        # orjson.JSONEncodeError is a TypeError
+        logger.warning(f"Failed to serialize value: {value}")
+        return {"S": str(value)}
+
+
+def _encode_list(value: Any) -> Dict[str, Any]:
+    """Encode a list as SS, NS or L, classifying its elements in one pass"""
+    if not value:
+        # Empty list
+        return {"L": []}
+        
+    all_str = all_num = True
+    numbers = []
+    for x in value:
+        if isinstance(x, str):
+            all_num = False
+        elif isinstance(x, (int, float)):
+            all_str = False
+            # Booleans are stored as numbers, same as scalar attributes
+            numbers.append(str(int(x)) if isinstance(x, bool) else str(x))
+        else:
+            all_str = all_num = False
+        if not (all_str or all_num):
+            # Mixed list
+            return {"L": [_encode_value(x) for x in value]}
+            
+    if all_str:
+        return {"SS": value}
+    return {"NS": numbers}
+
+
+def _encode_map(value: Dict[str, Any]) -> Dict[str, Any]:
+    """Encode a dict as M"""
+    encode = _encode_value
+    return {"M": {k: encode(v) for k, v in value.items()}}
+
+
+# Exact Python type -> encoder; subclasses such as str enums fall through to isinstance checks
+_ENCODERS = {
+    str: lambda v: {"S": v},
+    int: lambda v: {"N": str(v)},
+    float: lambda v: {"N": str(v)},
+    bool: lambda v: _TRUE_AV if v else _FALSE_AV,
+    type(None): lambda v: _NULL_AV,
+    datetime: lambda v: {"S": v.isoformat()},
+    date: lambda v: {"S": v.isoformat()},
+    # Stored bare, as before; orjson would write it JSON-quoted
+    uuid.UUID: lambda v: {"S": str(v)},
+    list: _encode_list,
+    tuple: _encode_list,
+    dict: _encode_map,
+}
+
+
+def _convert_to_dynamodb_item(item: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Convert Python dict to DynamoDB item format"""
+    encode = _encode_value
+    return {key: encode(value) for key, value in item.items()}
+
+
+def _convert_from_dynamodb_item(item: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """Convert DynamoDB item format to Python dict"""
+    if not item:
+        return {}
+
+    decode = _decode_value
+    return {key: decode(value) for key, value in item.items()}
+
+
+# Tables created by ensure_tables_exist; settings are fixed at import
+_TABLE_DEFINITIONS = (
+    # Agents table
+    {
+        "table_name": settings.AGENT_TABLE_NAME,
+        "key_schema": [
+            {"AttributeName": "tenant_id", "KeyType": "HASH"},
+            {"AttributeName": "id", "KeyType": "RANGE"}
+        ],
+        "attribute_definitions": [
+            {"AttributeName": "tenant_id", "AttributeType": "S"},
+            {"AttributeName": "id", "AttributeType": "S"},
+            {"AttributeName": "status", "AttributeType": "S"},
+            {"AttributeName": "type", "AttributeType": "S"}
+        ],
+        "provisioned_throughput": {
+            "ReadCapacityUnits": 5,
+            "WriteCapacityUnits": 5
+        },
+        "global_secondary_indexes": [
+            # Index for querying agents by type
+            {
+                "IndexName": "TenantTypeIndex",
+                "KeySchema": [
+                    {"AttributeName": "tenant_id", "KeyType": "HASH"},
+                    {"AttributeName": "type", "KeyType": "RANGE"}
+                ],
+                "Projection": {
+                    "ProjectionType": "ALL"
+                },
+                "ProvisionedThroughput": {
+                    "ReadCapacityUnits": 5,
+                    "WriteCapacityUnits": 5
+                }
+            },
+            # Index for querying agents by status
+            {
+                "IndexName": "TenantStatusIndex",
+                "KeySchema": [
+                    {"AttributeName": "tenant_id", "KeyType": "HASH"},
+                    {"AttributeName": "status", "KeyType": "RANGE"}
+                ],
+                "Projection": {
+                    "ProjectionType": "ALL"
+                },
+                "ProvisionedThroughput": {
+                    "ReadCapacityUnits": 5,
+                    "WriteCapacityUnits": 5
+                }
+            }
+        ]
+    },
+    # SSH keys table
+    {
+        "table_name": settings.SSH_KEY_TABLE_NAME,
+        "key_schema": [
+            {"AttributeName": "tenant_id", "KeyType": "HASH"},
+            {"AttributeName": "id", "KeyType": "RANGE"}
+        ],
+        "attribute_definitions": [
+            {"AttributeName": "tenant_id", "AttributeType": "S"},
+            {"AttributeName": "id", "AttributeType": "S"},
+            {"AttributeName": "agent_id", "AttributeType": "S"},
+            {"AttributeName": "key_type", "AttributeType": "S"}
+        ],
+        "provisioned_throughput": {
+            "ReadCapacityUnits": 5,
+            "WriteCapacityUnits": 5
+        },
+        "global_secondary_indexes": [
+            # Index for querying keys by agent
+            {
+                "IndexName": "TenantAgentIndex",
+                "KeySchema": [
+                    {"AttributeName": "tenant_id", "KeyType": "HASH"},
+                    {"AttributeName": "agent_id", "KeyType": "RANGE"}
+                ],
+                "Projection": {
+                    "ProjectionType": "ALL"
+                },
+                "ProvisionedThroughput": {
+                    "ReadCapacityUnits": 5,
+                    "WriteCapacityUnits": 5
+                }
+            },
+            # Index for querying keys by type
+            {
+                "IndexName": "TenantKeyTypeIndex",
+                "KeySchema": [
+                    {"AttributeName": "tenant_id", "KeyType": "HASH"},
+                    {"AttributeName": "key_type", "KeyType": "RANGE"}
+                ],
+                "Projection": {
+                    "ProjectionType": "ALL"
+                },
+                "ProvisionedThroughput": {
+                    "ReadCapacityUnits": 5,
+                    "WriteCapacityUnits": 5
+                }
+            }
+        ]
+    },
+    # Channels table
+    {
+        "table_name": settings.CHANNEL_TABLE_NAME,
+        "key_schema": [
+            {"AttributeName": "tenant_id", "KeyType": "HASH"},
+            {"AttributeName": "id", "KeyType": "RANGE"}
+        ],
+        "attribute_definitions": [
+            {"AttributeName": "tenant_id", "AttributeType": "S"},
+            {"AttributeName": "id", "AttributeType": "S"},
+            {"AttributeName": "status", "AttributeType": "S"}
+        ],
+        "provisioned_throughput": {
+            "ReadCapacityUnits": 5,
+            "WriteCapacityUnits": 5
+        },
+        "global_secondary_indexes": [
+            # Index for querying channels by status
+            {
+                "IndexName": "TenantStatusIndex",
+                "KeySchema": [
+                    {"AttributeName": "tenant_id", "KeyType": "HASH"},
+                    {"AttributeName": "status", "KeyType": "RANGE"}
+                ],
+                "Projection": {
+                    "ProjectionType": "ALL"
+                },
+                "ProvisionedThroughput": {
+                    "ReadCapacityUnits": 5,
+                    "WriteCapacityUnits": 5
+                }
+            }
+        ]
+    },
+    # Tenants table
+    {
+        "table_name": settings.TENANT_TABLE_NAME,
+        "key_schema": [
+            {"AttributeName": "id", "KeyType": "HASH"}
+        ],
+        "attribute_definitions": [
+            {"AttributeName": "id", "AttributeType": "S"},
+            {"AttributeName": "status", "AttributeType": "S"}
+        ],
+        "provisioned_throughput": {
+            "ReadCapacityUnits": 5,
+            "WriteCapacityUnits": 5
+        },
+        "global_secondary_indexes": [
+            # Index for querying tenants by status
+            {
+                "IndexName": "StatusIndex",
+                "KeySchema": [
+                    {"AttributeName": "status", "KeyType": "HASH"}
+                ],
+                "Projection": {
+                    "ProjectionType": "ALL"
+                },
+                "ProvisionedThroughput": {
+                    "ReadCapacityUnits": 5,
+                    "WriteCapacityUnits": 5
+                }
+            }
+        ]
+    },
+    # Usage metrics table
+    {
+        "table_name": settings.USAGE_METRICS_TABLE_NAME,
+        "key_schema": [
+            {"AttributeName": "tenant_id", "KeyType": "HASH"},
+            {"AttributeName": "date", "KeyType": "RANGE"}
+        ],
+        "attribute_definitions": [
+            {"AttributeName": "tenant_id", "AttributeType": "S"},
+            {"AttributeName": "date", "AttributeType": "S"},
+            {"AttributeName": "metric_type", "AttributeType": "S"}
+        ],
+        "provisioned_throughput": {
+            "ReadCapacityUnits": 5,
+            "WriteCapacityUnits": 5
+        },
+        "global_secondary_indexes": [
+            # Index for querying usage by metric type and tenant
+            {
+                "IndexName": "TenantMetricTypeIndex",
+                "KeySchema": [
+                    {"AttributeName": "tenant_id", "KeyType": "HASH"},
+                    {"AttributeName": "metric_type", "KeyType": "RANGE"}
+                ],
+                "Projection": {
+                    "ProjectionType": "ALL"
+                },
+                "ProvisionedThroughput": {
+                    "ReadCapacityUnits": 5,
+                    "WriteCapacityUnits": 5
+                }
+            }
+        ]
+    }
+)
+
+
+
+# One worker per pooled connection so calls aren't queued behind other to_thread users.
+# Shared by every DynamoDBService, like the client and its connection pool.
+_EXECUTOR = ThreadPoolExecutor(
+    max_workers=CLIENT_CONFIG.max_pool_connections,
+    thread_name_prefix="dynamodb"
+)
+
+
+# get_item read-through cache shared by every DynamoDBService, for the tables in
+# settings.DYNAMODB_READ_CACHE_TABLES: {table_name: {key values: (expires_at, raw
+# DynamoDB item)}}. Raw items are decoded on each hit so callers never share (and
+# mutate) the same dict. The cache is per process: writes made by other workers,
+# or outside this module, are not seen until the entry expires.
+_READ_CACHE: Dict[str, Dict[tuple, tuple]] = {}
+
+# Generation of the last write to each cached key, {(table_name, key values): generation}.
+# get_item only stores its result if no write landed while the read was in flight.
+_WRITE_GENERATIONS: Dict[tuple, int] = {}
+_write_counter = 0
+# Highest generation evicted from _WRITE_GENERATIONS; stands in for any missing key
+_evicted_generation = 0
+
+
+def _write_generation(table_name: str, cache_key: tuple) -> int:
+    """Generation of the last write to a cached key"""
+    return _WRITE_GENERATIONS.get((table_name, cache_key), _evicted_generation)
+
+
+def _record_write(table_name: str, cache_key: tuple) -> None:
+    """Mark a cached key as written"""
+    global _write_counter, _evicted_generation
+    _write_counter += 1
+    _WRITE_GENERATIONS.pop((table_name, cache_key), None)
+    if len(_WRITE_GENERATIONS) >= READ_CACHE_MAX_ITEMS:
+        # Drop the least recently written key; missing keys read as this generation
+        oldest = next(iter(_WRITE_GENERATIONS))
+        _evicted_generation = max(_evicted_generation, _WRITE_GENERATIONS.pop(oldest))
+    _WRITE_GENERATIONS[(table_name, cache_key)] = _write_counter
+
+@lru_cache(maxsize=256)
+def _update_expression(attr_names: frozenset) -> tuple:
+    """UpdateExpression and ExpressionAttributeNames for a set of updated attributes"""
+    return (
+        "SET " + ", ".join(f"#{attr_name} = :{attr_name}" for attr_name in attr_names),
+        {f"#{attr_name}": attr_name for attr_name in attr_names}
+    )
+
+@lru_cache(maxsize=4)
+def _create_dynamodb_client(endpoint_url: Optional[str], access_key_id: Optional[str],
+                            secret_access_key: Optional[str], region_name: str):
+    """Create DynamoDB client, shared by every service instance with the same settings"""
+    config = {}
+    
+    # Use local endpoint if configured (for development)
+    if endpoint_url:
+        config["endpoint_url"] = endpoint_url
+        
+    # Use AWS credentials if configured
+    if access_key_id and secret_access_key:
+        config["aws_access_key_id"] = access_key_id
+        config["aws_secret_access_key"] = secret_access_key
+        
+    # Use AWS region
+    config["region_name"] = region_name
+    
+    return boto3.client("dynamodb", config=CLIENT_CONFIG, **config)
+
+@dataclass(frozen=True)
+class _TableAccess:
+    """Key schema of a table from _TABLE_DEFINITIONS, resolved once"""
+    name: str
+    key_names: tuple
+    
+    def encode_key(self, key: Dict[str, Any]) -> Optional[Dict[str, Dict[str, str]]]:
+        """Encode a key whose attributes are exactly this table's string key attributes"""
+        if len(key) != len(self.key_names):
+            return None
+        encoded = {}
+        for name in self.key_names:
+            value = key.get(name)
+            if type(value) is not str:
+                return None
+            encoded[name] = {"S": value}
+        return encoded
+
 
 class DynamoDBService:
     """DynamoDB service for ArtCafe pub/sub"""
     
     def __init__(self):
         """Initialize DynamoDB service"""
-        self.client = self._create_dynamodb_client()
+        self.client = _create_dynamodb_client(
+            settings.DYNAMODB_ENDPOINT,
+            settings.AWS_ACCESS_KEY_ID,
+            settings.AWS_SECRET_ACCESS_KEY,
+            settings.AWS_REGION
+        )
+        self.read_client = self._create_read_client()
+        self._executor = _EXECUTOR
         
-    def _create_dynamodb_client(self):
-        """Create DynamoDB client"""
-        config = {}
+        # Tables already created or reconciled by this process
+        self._ensured_tables: set = set()
+        self._describe_cache: Dict[str, tuple] = {}
         
-        # Use local endpoint if configured (for development)
-        if settings.DYNAMODB_ENDPOINT:
-            config["endpoint_url"] = settings.DYNAMODB_ENDPOINT
+        # Key schemas of the tables we define, for encoding keys without the generic converter
+        self._tables = {
+            table["table_name"]: _TableAccess(
+                name=table["table_name"],
+                key_names=tuple(k["AttributeName"] for k in table["key_schema"])
+            )
+            for table in _TABLE_DEFINITIONS
+        }
+                
+    def _create_read_client(self):
+        """Create DAX client for reads if configured, otherwise reuse the DynamoDB client"""
+        if not settings.DAX_ENDPOINT:
+            return self.client
             
-        # Use AWS credentials if configured
-        if settings.AWS_ACCESS_KEY_ID and settings.AWS_SECRET_ACCESS_KEY:
-            config["aws_access_key_id"] = settings.AWS_ACCESS_KEY_ID
-            config["aws_secret_access_key"] = settings.AWS_SECRET_ACCESS_KEY
+        if AmazonDaxClient is None:
+            logger.warning("DAX_ENDPOINT is set but amazondax is not installed, reading from DynamoDB")
+            return self.client
             
-        # Use AWS region
-        config["region_name"] = settings.AWS_REGION
-        
-        return boto3.client("dynamodb", **config)
+        try:
+            return AmazonDaxClient(
+                endpoint_url=settings.DAX_ENDPOINT,
+                region_name=settings.AWS_REGION
+            )
+        except Exception as e:
+            logger.error(f"Error creating DAX client, reading from DynamoDB: {e}")
+            return self.client
     
-    def _fix_booleans_for_dynamodb(self, data: Any) -> Any:
-        """Recursively convert all boolean values to numbers"""
-        if isinstance(data, dict):
-            fixed = {}
-            for key, value in data.items():
-                fixed[key] = self._fix_booleans_for_dynamodb(value)
-            return fixed
-        elif isinstance(data, list):
-            return [self._fix_booleans_for_dynamodb(item) for item in data]
-        elif isinstance(data, bool):
-            return 1 if data else 0
-        else:
-            return data
-
-    def _convert_to_dynamodb_item(self, item: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
-        """Convert Python dict to DynamoDB item format"""
-        # First, convert all boolean values to numbers
-        fixed_item = self._fix_booleans_for_dynamodb(item)
-        
-        result = {}
-        for key, value in fixed_item.items():
-            if isinstance(value, str):
-                result[key] = {"S": value}
-            elif isinstance(value, (int, float)):
-                result[key] = {"N": str(value)}
-            elif isinstance(value, bool):
-                # This should not happen after fix, but just in case
-                result[key] = {"N": "1" if value else "0"}
-            elif isinstance(value, (list, tuple)):
-                if not value:
-                    # Empty list
-                    result[key] = {"L": []}
-                elif all(isinstance(x, str) for x in value):
-                    # List of strings
-                    result[key] = {"SS": value}
-                elif all(isinstance(x, (int, float)) for x in value):
-                    # List of numbers
-                    result[key] = {"NS": [str(x) for x in value]}
-                else:
-                    # Mixed list
-                    result[key] = {"L": [self._convert_to_dynamodb_item({"value": x})["value"] for x in value]}
-            elif isinstance(value, dict):
-                result[key] = {"M": self._convert_to_dynamodb_item(value)}
-            elif isinstance(value, (datetime, date)):
-                result[key] = {"S": value.isoformat()}
-            elif value is None:
-                result[key] = {"NULL": True}
-            else:
-                # Try to JSON serialize
-                try:
-                    result[key] = {"S": json.dumps(value)}
-                except:
-                    logger.warning(f"Failed to serialize value for key {key}: {value}")
-                    result[key] = {"S": str(value)}
+    async def _call(self, operation, **kwargs) -> Dict[str, Any]:
+        """
+        Run a blocking client operation on the DynamoDB worker pool
         
-        return result
+        Args:
+            operation: Bound boto3 client method
+            **kwargs: Operation parameters
+            
+        Returns:
+            Operation response
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(operation, **kwargs))
+    
+    async def _read(self, operation: str, **kwargs) -> Dict[str, Any]:
+        """
+        Run a read operation through DAX when configured, retrying once against DynamoDB
         
-    def _convert_from_dynamodb_item(self, item: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
-        """Convert DynamoDB item format to Python dict"""
-        if not item:
-            return {}
+        Args:
+            operation: Client operation name (get_item, query, scan)
+            **kwargs: Operation parameters
             
-        result = {}
-        for key, value in item.items():
-            if "S" in value:
-                result[key] = value["S"]
-            elif "N" in value:
-                # Convert to int if possible, otherwise float
-                try:
-                    if "." in value["N"]:
-                        result[key] = float(value["N"])
-                    else:
-                        result[key] = int(value["N"])
-                except:
-                    result[key] = float(value["N"])
-            elif "BOOL" in value:
-                result[key] = value["BOOL"]
-            elif "NULL" in value:
-                result[key] = None
-            elif "L" in value:
-                result[key] = [self._convert_from_dynamodb_item({"value": x})["value"] for x in value["L"]]
-            elif "M" in value:
-                result[key] = self._convert_from_dynamodb_item(value["M"])
-            elif "SS" in value:
-                result[key] = list(value["SS"])
-            elif "NS" in value:
-                result[key] = [int(x) if x.isdigit() else float(x) for x in value["NS"]]
-            else:
-                logger.warning(f"Unknown DynamoDB type for key {key}: {value}")
-                result[key] = str(value)
+        Returns:
+            Operation response
+        """
+        if self.read_client is self.client:
+            return await self._call(getattr(self.client, operation), **kwargs)
+            
+        try:
+            return await self._call(getattr(self.read_client, operation), **kwargs)
+        except Exception as e:
+            logger.warning(f"DAX {operation} failed, retrying against DynamoDB: {e}")
+            return await self._call(getattr(self.client, operation), **kwargs)
+    
+    def _encode_key(self, table_name: str, key: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """Convert a primary key to DynamoDB format, using the table's known key schema when it fits"""
+        access = self._tables.get(table_name)
+        if access is not None:
+            encoded = access.encode_key(key)
+            if encoded is not None:
+                return encoded
+        return _convert_to_dynamodb_item(key)
+    
+    def _partition_key(self, table_name: str) -> str:
+        """Partition key attribute of a table from _TABLE_DEFINITIONS, "id" for other tables"""
+        access = self._tables.get(table_name)
+        return access.key_names[0] if access is not None else "id"
+        
+    def _read_cache_key(self, table_name: str, key: Dict[str, Any]) -> Optional[tuple]:
+        """Key values of an item in a read-cached table, or None if the key isn't cached"""
+        if settings.DYNAMODB_READ_CACHE_TTL <= 0 or table_name not in settings.DYNAMODB_READ_CACHE_TABLES:
+            return None
+        access = self._tables.get(table_name)
+        if access is None or access.encode_key(key) is None:
+            return None
+        return tuple(key[name] for name in access.key_names)
+        
+    def _cache_item(self, table_name: str, cache_key: tuple,
+                    raw_item: Dict[str, Dict[str, Any]]) -> None:
+        """Store a raw item in the get_item read cache"""
+        table_cache = _READ_CACHE.setdefault(table_name, {})
+        if len(table_cache) >= READ_CACHE_MAX_ITEMS:
+            # Drop the oldest entry
+            del table_cache[next(iter(table_cache))]
+        table_cache[cache_key] = (time.monotonic() + settings.DYNAMODB_READ_CACHE_TTL, raw_item)
+        
+    def _uncache_key(self, table_name: str, key: Dict[str, Any]) -> None:
+        """Drop a cached get_item result"""
+        cache_key = self._read_cache_key(table_name, key)
+        if cache_key is None:
+            return
+        _record_write(table_name, cache_key)
+        _READ_CACHE.get(table_name, {}).pop(cache_key, None)
                 
-        return result
+    def _refresh_cached_item(self, table_name: str, item: Optional[Dict[str, Any]],
+                             raw_item: Dict[str, Dict[str, Any]]) -> None:
+        """Replace the cached copy of a written item"""
+        access = self._tables.get(table_name)
+        if access is None or table_name not in settings.DYNAMODB_READ_CACHE_TABLES:
+            return
+        if item is None:
+            item = _convert_from_dynamodb_item({name: raw_item[name] for name in access.key_names if name in raw_item})
+        cache_key = self._read_cache_key(table_name, {name: item.get(name) for name in access.key_names})
+        if cache_key is None:
+            return
+        _record_write(table_name, cache_key)
+        self._cache_item(table_name, cache_key, raw_item)
     
     async def get_item(self, table_name: str, key: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
@@ -139,58 +660,79 @@ class DynamoDBService:
         Returns:
             Item or None if not found
         """
+        cache_key = self._read_cache_key(table_name, key)
+        if cache_key is not None:
+            cached = _READ_CACHE.get(table_name, {}).get(cache_key)
+            if cached and cached[0] > time.monotonic():
+                return _convert_from_dynamodb_item(cached[1])
+            generation = _write_generation(table_name, cache_key)
+                
         try:
-            response = self.client.get_item(
+            response = await self._read(
+                "get_item",
                 TableName=table_name,
-                Key=self._convert_to_dynamodb_item(key)
+                Key=self._encode_key(table_name, key)
             )
             
             if "Item" not in response:
                 return None
                 
-            return self._convert_from_dynamodb_item(response["Item"])
+            # A write that finished during the read may be newer than this item
+            if cache_key is not None and _write_generation(table_name, cache_key) == generation:
+                self._cache_item(table_name, cache_key, response["Item"])
+            return _convert_from_dynamodb_item(response["Item"])
         except Exception as e:
             logger.error(f"Error getting item from {table_name}: {e}")
             return None
             
-    async def put_item(self, table_name: str, item: Dict[str, Any]) -> Dict[str, Any]:
+    async def put_item(self, table_name: str, item: Dict[str, Any],
+                       insert_only: bool = False) -> Dict[str, Any]:
         """
         Put item in DynamoDB table
         
         Args:
             table_name: Table name
             item: Item to put
+            insert_only: Fail instead of overwriting an item with the same primary key
             
         Returns:
             Item
+            
+        Raises:
+            ConditionalCheckFailedException: insert_only and the primary key already exists
         """
         try:
             # Add timestamps
-            if "created_at" not in item:
-                item["created_at"] = datetime.utcnow().isoformat()
-            if "updated_at" not in item:
-                item["updated_at"] = datetime.utcnow().isoformat()
+            now = _now_iso()
+            item.setdefault("created_at", now)
+            item.setdefault("updated_at", now)
                 
             # Add ID if not present
             if "id" not in item:
                 item["id"] = str(uuid.uuid4())
             
-            # Debug: log the item being saved
-            logger.info(f"[DYNAMODB_DEBUG] Putting item to {table_name}: {item}")
-            
             # Convert item for DynamoDB
-            dynamodb_item = self._convert_to_dynamodb_item(item)
-            logger.info(f"[DYNAMODB_DEBUG] Converted item: {dynamodb_item}")
+            dynamodb_item = _convert_to_dynamodb_item(item)
             
-            self.client.put_item(
-                TableName=table_name,
-                Item=dynamodb_item
-            )
+            put_params = {
+                "TableName": table_name,
+                "Item": dynamodb_item
+            }
+            if insert_only:
+                # No item exists under the key if its partition key attribute is absent
+                put_params["ConditionExpression"] = "attribute_not_exists(#pk)"
+                put_params["ExpressionAttributeNames"] = {"#pk": self._partition_key(table_name)}
+                
+            await self._call(self.client.put_item, **put_params)
             
+            self._refresh_cached_item(table_name, item, dynamodb_item)
             return item
+        except self.client.exceptions.ConditionalCheckFailedException:
+            logger.info(f"Item {item.get(self._partition_key(table_name))} already exists in {table_name}")
+            raise
         except Exception as e:
             logger.error(f"Error putting item in {table_name}: {e}")
-            logger.error(f"[DYNAMODB_DEBUG] Failed item: {item}")
+            logger.debug("Failed item: %r", item)
             raise
             
     async def update_item(self, table_name: str, key: Dict[str, Any], 
@@ -208,40 +750,22 @@ class DynamoDBService:
         """
         try:
             # Add updated_at timestamp
-            updates["updated_at"] = datetime.utcnow().isoformat()
+            updates["updated_at"] = _now_iso()
             
-            # Build update expression
-            update_expressions = []
-            expression_attribute_names = {}
-            expression_attribute_values = {}
+            # Expression and names only depend on which attributes change, so reuse them
+            update_expression, expression_attribute_names = _update_expression(frozenset(updates))
             
-            # Process each update
-            for attr_name, attr_value in updates.items():
-                update_expressions.append(f"#{attr_name} = :{attr_name}")
-                expression_attribute_names[f"#{attr_name}"] = attr_name
-                
-                # Convert value to DynamoDB format
-                if isinstance(attr_value, str):
-                    expression_attribute_values[f":{attr_name}"] = {"S": attr_value}
-                elif isinstance(attr_value, (int, float)):
-                    expression_attribute_values[f":{attr_name}"] = {"N": str(attr_value)}
-                elif isinstance(attr_value, bool):
-                    expression_attribute_values[f":{attr_name}"] = {"BOOL": attr_value}
-                elif attr_value is None:
-                    expression_attribute_values[f":{attr_name}"] = {"NULL": True}
-                else:
-                    # Use the existing conversion method for complex types
-                    temp_key = f"temp_{attr_name}"
-                    converted = self._convert_to_dynamodb_item({temp_key: attr_value})
-                    expression_attribute_values[f":{attr_name}"] = converted[temp_key]
-                
-            # Create update expression
-            update_expression = "SET " + ", ".join(update_expressions)
+            # Only the values are built per call
+            encode = _encode_value
+            expression_attribute_values = {
+                f":{attr_name}": encode(attr_value) for attr_name, attr_value in updates.items()
+            }
             
             # Perform update
-            response = self.client.update_item(
+            response = await self._call(
+                self.client.update_item,
                 TableName=table_name,
-                Key=self._convert_to_dynamodb_item(key),
+                Key=self._encode_key(table_name, key),
                 UpdateExpression=update_expression,
                 ExpressionAttributeNames=expression_attribute_names,
                 ExpressionAttributeValues=expression_attribute_values,
@@ -249,7 +773,11 @@ class DynamoDBService:
             )
             
             # Return updated item
-            return self._convert_from_dynamodb_item(response["Attributes"])
+            cache_key = self._read_cache_key(table_name, key)
+            if cache_key is not None:
+                _record_write(table_name, cache_key)
+                self._cache_item(table_name, cache_key, response["Attributes"])
+            return _convert_from_dynamodb_item(response["Attributes"])
         except Exception as e:
             logger.error(f"Error updating item in {table_name}: {e}")
             raise
@@ -266,15 +794,137 @@ class DynamoDBService:
             True if item was deleted
         """
         try:
-            self.client.delete_item(
+            await self._call(
+                self.client.delete_item,
                 TableName=table_name,
-                Key=self._convert_to_dynamodb_item(key)
+                Key=self._encode_key(table_name, key)
             )
+            self._uncache_key(table_name, key)
             return True
         except Exception as e:
             logger.error(f"Error deleting item from {table_name}: {e}")
             return False
             
+    async def batch_put_items(self, table_name: str, items: List[Dict[str, Any]],
+                              pool_size: int = 4) -> List[Dict[str, Any]]:
+        """
+        Put items in DynamoDB table using BatchWriteItem
+        
+        Args:
+            table_name: Table name
+            items: Items to put
+            pool_size: Number of 25-item batches written concurrently
+            
+        Returns:
+            Items
+        """
+        now = _now_iso()
+        for item in items:
+            item.setdefault("created_at", now)
+            item.setdefault("updated_at", now)
+            if "id" not in item:
+                item["id"] = str(uuid.uuid4())
+                
+        await self.batch_write_items(table_name, puts=items, pool_size=pool_size)
+        return items
+            
+    async def batch_write_items(self, table_name: str,
+                                puts: Optional[List[Dict[str, Any]]] = None,
+                                deletes: Optional[List[Dict[str, Any]]] = None,
+                                pool_size: int = 4) -> bool:
+        """
+        Put and delete items in DynamoDB table using BatchWriteItem
+        
+        Args:
+            table_name: Table name
+            puts: Items to put as-is
+            deletes: Primary keys of items to delete
+            pool_size: Number of 25-item batches written concurrently
+            
+        Returns:
+            True if all requests were processed
+        """
+        try:
+            requests = [{"PutRequest": {"Item": _convert_to_dynamodb_item(item)}} for item in puts or ()]
+            requests += [{"DeleteRequest": {"Key": self._encode_key(table_name, key)}} for key in deletes or ()]
+            
+            semaphore = asyncio.Semaphore(pool_size)
+            
+            async def write_chunk(chunk: List[Dict[str, Any]]) -> None:
+                async with semaphore:
+                    await self._write_batch({table_name: chunk})
+            
+            await asyncio.gather(*[
+                write_chunk(requests[start:start + BATCH_WRITE_SIZE])
+                for start in range(0, len(requests), BATCH_WRITE_SIZE)
+            ])
+            
+            for request in requests:
+                if "PutRequest" in request:
+                    self._refresh_cached_item(table_name, None, request["PutRequest"]["Item"])
+                else:
+                    self._uncache_key(table_name, _convert_from_dynamodb_item(request["DeleteRequest"]["Key"]))
+            
+            return True
+        except Exception as e:
+            logger.error(f"Error batch writing items in {table_name}: {e}")
+            raise
+            
+    async def batch_get_items(self, table_name: str, keys: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Get items from DynamoDB table using BatchGetItem
+        
+        Args:
+            table_name: Table name
+            keys: Distinct primary keys
+            
+        Returns:
+            Found items, in no particular order
+        """
+        async def get_chunk(chunk: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+            request_items = {table_name: {"Keys": [self._encode_key(table_name, key) for key in chunk]}}
+            found = []
+            for attempt in range(BATCH_MAX_RETRIES + 1):
+                response = await self._read("batch_get_item", RequestItems=request_items)
+                found.extend(_decode_items(response.get("Responses", {}).get(table_name, [])))
+                request_items = response.get("UnprocessedKeys")
+                if not request_items:
+                    return found
+                if attempt < BATCH_MAX_RETRIES:
+                    await _backoff(attempt)
+            raise RuntimeError(f"BatchGetItem left unprocessed keys after {BATCH_MAX_RETRIES} retries")
+            
+        try:
+            chunks = await asyncio.gather(*[
+                get_chunk(keys[start:start + BATCH_GET_SIZE])
+                for start in range(0, len(keys), BATCH_GET_SIZE)
+            ])
+            return [item for chunk in chunks for item in chunk]
+        except Exception as e:
+            logger.error(f"Error batch getting items from {table_name}: {e}")
+            raise
+            
+    async def _write_batch(self, request_items: Dict[str, List[Dict[str, Any]]]) -> None:
+        """
+        Issue a BatchWriteItem, retrying unprocessed items with exponential backoff
+        
+        Args:
+            request_items: BatchWriteItem RequestItems map
+        """
+        for attempt in range(BATCH_MAX_RETRIES + 1):
+            response = await self._call(
+                self.client.batch_write_item,
+                RequestItems=request_items
+            )
+            request_items = response.get("UnprocessedItems")
+            if not request_items:
+                return
+            
+            if attempt < BATCH_MAX_RETRIES:
+                await _backoff(attempt)
+        
+        raise RuntimeError(f"BatchWriteItem left unprocessed items after {BATCH_MAX_RETRIES} retries")
+            
     async def query_items(self, table_name: str, key_condition: str,
                         expression_values: Dict[str, Any], 
                         index_name: Optional[str] = None,
@@ -295,50 +945,15 @@ class DynamoDBService:
             Query results
         """
         try:
-            # Convert expression values to DynamoDB format
-            dynamo_expression_values = {}
-            for k, v in expression_values.items():
-                if isinstance(v, str):
-                    dynamo_expression_values[k] = {"S": v}
-                elif isinstance(v, (int, float)):
-                    dynamo_expression_values[k] = {"N": str(v)}
-                elif isinstance(v, bool):
-                    dynamo_expression_values[k] = {"BOOL": v}
-                else:
-                    # For complex types, use the conversion method
-                    converted = self._convert_to_dynamodb_item({k: v})
-                    dynamo_expression_values[k] = converted[k]
-            
-            # Build query parameters
-            query_params = {
-                "TableName": table_name,
-                "KeyConditionExpression": key_condition,
-                "ExpressionAttributeValues": dynamo_expression_values
-            }
-            
-            # Add optional parameters
-            if index_name:
-                query_params["IndexName"] = index_name
-            if limit:
-                query_params["Limit"] = limit
+            query_params = self._query_params(
+                table_name, key_condition, expression_values, index_name, limit
+            )
             if next_token:
-                query_params["ExclusiveStartKey"] = json.loads(next_token)
+                query_params["ExclusiveStartKey"] = _decode_token(next_token)
                 
             # Execute query
-            response = self.client.query(**query_params)
-            
-            # Parse results
-            items = [self._convert_from_dynamodb_item(item) for item in response.get("Items", [])]
-            
-            # Get pagination token
-            pagination_token = None
-            if "LastEvaluatedKey" in response:
-                pagination_token = json.dumps(response["LastEvaluatedKey"])
-                
-            return {
-                "items": items,
-                "next_token": pagination_token
-            }
+            response = await self._read("query", **query_params)
+            return self._decode_page(response)
         except Exception as e:
             logger.error(f"Error querying items from {table_name}: {e}")
             raise
@@ -348,7 +963,9 @@ class DynamoDBService:
                        expression_values: Optional[Dict[str, Any]] = None,
                        expression_attribute_names: Optional[Dict[str, str]] = None,
                        limit: Optional[int] = None,
-                       next_token: Optional[str] = None) -> Dict[str, Any]:
+                       next_token: Optional[str] = None,
+                       segment: Optional[int] = None,
+                       total_segments: Optional[int] = None) -> Dict[str, Any]:
         """
         Scan items from DynamoDB table
         
@@ -358,65 +975,233 @@ class DynamoDBService:
             expression_values: Optional expression attribute values
             limit: Optional result limit
             next_token: Optional pagination token
+            segment: Optional parallel scan segment
+            total_segments: Total parallel scan segments, required with segment
             
         Returns:
             Scan results
         """
         try:
-            # Build scan parameters
-            scan_params = {
-                "TableName": table_name
-            }
-            
-            # Add optional parameters
-            if filter_expression:
-                scan_params["FilterExpression"] = filter_expression
-            
-            if expression_values:
-                # Convert expression values to DynamoDB format properly
-                dynamo_expression_values = {}
-                for k, v in expression_values.items():
-                    if isinstance(v, str):
-                        dynamo_expression_values[k] = {"S": v}
-                    elif isinstance(v, (int, float)):
-                        dynamo_expression_values[k] = {"N": str(v)}
-                    elif isinstance(v, bool):
-                        dynamo_expression_values[k] = {"BOOL": v}
-                    else:
-                        # Use the existing conversion method
-                        converted = self._convert_to_dynamodb_item({k[1:]: v})
-                        dynamo_expression_values[k] = list(converted.values())[0]
-                
-                scan_params["ExpressionAttributeValues"] = dynamo_expression_values
-            
-            if expression_attribute_names:
-                scan_params["ExpressionAttributeNames"] = expression_attribute_names
-                
-            if limit:
-                scan_params["Limit"] = limit
-                
+            scan_params = self._scan_params(
+                table_name, filter_expression, expression_values,
+                expression_attribute_names, limit, segment, total_segments
+            )
             if next_token:
-                scan_params["ExclusiveStartKey"] = json.loads(next_token)
+                scan_params["ExclusiveStartKey"] = _decode_token(next_token)
                 
             # Execute scan
-            response = self.client.scan(**scan_params)
-            
-            # Parse results
-            items = [self._convert_from_dynamodb_item(item) for item in response.get("Items", [])]
-            
-            # Get pagination token
-            pagination_token = None
-            if "LastEvaluatedKey" in response:
-                pagination_token = json.dumps(response["LastEvaluatedKey"])
-                
-            return {
-                "items": items,
-                "next_token": pagination_token
-            }
+            response = await self._read("scan", **scan_params)
+            return self._decode_page(response)
         except Exception as e:
             logger.error(f"Error scanning items from {table_name}: {e}")
             raise
             
+    def _query_params(self, table_name: str, key_condition: str,
+                      expression_values: Dict[str, Any],
+                      index_name: Optional[str] = None,
+                      limit: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Build query request parameters
+        
+        Args:
+            table_name: Table name
+            key_condition: Key condition expression
+            expression_values: Expression attribute values
+            index_name: Optional index name
+            limit: Optional per-page limit
+            
+        Returns:
+            Query parameters without a start key
+        """
+        # Convert expression values to DynamoDB format; ":name" keys pass through unchanged
+        query_params = {
+            "TableName": table_name,
+            "KeyConditionExpression": key_condition,
+            "ExpressionAttributeValues": _convert_to_dynamodb_item(expression_values)
+        }
+        
+        # Add optional parameters
+        if index_name:
+            query_params["IndexName"] = index_name
+        if limit:
+            query_params["Limit"] = limit
+        return query_params
+        
+    def _scan_params(self, table_name: str,
+                     filter_expression: Optional[str] = None,
+                     expression_values: Optional[Dict[str, Any]] = None,
+                     expression_attribute_names: Optional[Dict[str, str]] = None,
+                     limit: Optional[int] = None,
+                     segment: Optional[int] = None,
+                     total_segments: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Build scan request parameters
+        
+        Args:
+            table_name: Table name
+            filter_expression: Optional filter expression
+            expression_values: Optional expression attribute values
+            expression_attribute_names: Optional expression attribute names
+            limit: Optional per-page limit
+            segment: Optional parallel scan segment
+            total_segments: Total parallel scan segments, required with segment
+            
+        Returns:
+            Scan parameters without a start key
+        """
+        scan_params = {
+            "TableName": table_name
+        }
+        
+        # Add optional parameters
+        if filter_expression:
+            scan_params["FilterExpression"] = filter_expression
+        if expression_values:
+            # Convert expression values to DynamoDB format; ":name" keys pass through unchanged
+            scan_params["ExpressionAttributeValues"] = _convert_to_dynamodb_item(expression_values)
+        if expression_attribute_names:
+            scan_params["ExpressionAttributeNames"] = expression_attribute_names
+        if limit:
+            scan_params["Limit"] = limit
+        if total_segments:
+            scan_params["Segment"] = segment
+            scan_params["TotalSegments"] = total_segments
+        return scan_params
+        
+    def _decode_page(self, response: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Decode a single query/scan response page
+        
+        Args:
+            response: Raw query or scan response
+            
+        Returns:
+            Items and the pagination token for the next page
+        """
+        # Get pagination token
+        pagination_token = None
+        if "LastEvaluatedKey" in response:
+            pagination_token = _encode_token(response["LastEvaluatedKey"])
+            
+        return {
+            "items": _decode_items(response.get("Items", [])),
+            "next_token": pagination_token
+        }
+        
+    async def iter_query(self, table_name: str, key_condition: str,
+                         expression_values: Dict[str, Any],
+                         index_name: Optional[str] = None,
+                         page_size: Optional[int] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over every item matching a query, across all pages
+        
+        Args:
+            table_name: Table name
+            key_condition: Key condition expression
+            expression_values: Expression attribute values
+            index_name: Optional index name
+            page_size: Optional per-page limit
+            
+        Yields:
+            Items
+        """
+        query_params = self._query_params(
+            table_name, key_condition, expression_values, index_name, page_size
+        )
+        async for item in self._iter_pages("query", query_params):
+            yield item
+            
+    async def iter_scan(self, table_name: str,
+                        filter_expression: Optional[str] = None,
+                        expression_values: Optional[Dict[str, Any]] = None,
+                        expression_attribute_names: Optional[Dict[str, str]] = None,
+                        page_size: Optional[int] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over every item in a scan, across all pages
+        
+        Args:
+            table_name: Table name
+            filter_expression: Optional filter expression
+            expression_values: Optional expression attribute values
+            expression_attribute_names: Optional expression attribute names
+            page_size: Optional per-page limit
+            
+        Yields:
+            Items
+        """
+        scan_params = self._scan_params(
+            table_name, filter_expression, expression_values,
+            expression_attribute_names, page_size
+        )
+        async for item in self._iter_pages("scan", scan_params):
+            yield item
+            
+    async def parallel_scan_items(self, table_name: str,
+                                  total_segments: int = 4,
+                                  filter_expression: Optional[str] = None,
+                                  expression_values: Optional[Dict[str, Any]] = None,
+                                  expression_attribute_names: Optional[Dict[str, str]] = None,
+                                  page_size: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Scan a whole table as concurrent segments
+        
+        Args:
+            table_name: Table name
+            total_segments: Number of segments scanned concurrently
+            filter_expression: Optional filter expression
+            expression_values: Optional expression attribute values
+            expression_attribute_names: Optional expression attribute names
+            page_size: Optional per-page limit
+            
+        Returns:
+            All items, segment by segment
+        """
+        async def scan_segment(segment: int) -> List[Dict[str, Any]]:
+            scan_params = self._scan_params(
+                table_name, filter_expression, expression_values,
+                expression_attribute_names, page_size, segment, total_segments
+            )
+            return [item async for item in self._iter_pages("scan", scan_params)]
+            
+        segments = await asyncio.gather(*[scan_segment(i) for i in range(total_segments)])
+        return [item for items in segments for item in items]
+            
+    async def _iter_pages(self, operation: str, params: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield items page by page, requesting the next page while the current one is consumed
+        
+        Raw pages are decoded one item at a time as they are yielded, so only
+        the current and the prefetched page are ever held in memory.
+        
+        Args:
+            operation: Read operation, "query" or "scan"
+            params: Request parameters without a start key
+            
+        Yields:
+            Items
+        """
+        pending = None
+        try:
+            response = await self._read(operation, **params)
+            while True:
+                last_key = response.get("LastEvaluatedKey")
+                if last_key:
+                    pending = asyncio.create_task(
+                        self._read(operation, **params, ExclusiveStartKey=last_key)
+                    )
+                    
+                for item in response.get("Items", ()):
+                    yield _convert_from_dynamodb_item(item)
+                    
+                if pending is None:
+                    return
+                response = await pending
+                pending = None
+        finally:
+            # Caller stopped early; drop the prefetched page
+            if pending is not None:
+                pending.cancel()
+                
     async def create_table(self, table_name: str, key_schema: List[Dict[str, str]],
                          attribute_definitions: List[Dict[str, str]],
                          provisioned_throughput: Dict[str, int],
@@ -434,6 +1219,9 @@ class DynamoDBService:
         Returns:
             True if table was created
         """
+        if table_name in self._ensured_tables:
+            return True
+            
         try:
             create_params = {
                 "TableName": table_name,
@@ -446,7 +1234,8 @@ class DynamoDBService:
             if global_secondary_indexes:
                 create_params["GlobalSecondaryIndexes"] = global_secondary_indexes
             
-            self.client.create_table(**create_params)
+            await self._call(self.client.create_table, **create_params)
+            self._ensured_tables.add(table_name)
             return True
         except self.client.exceptions.ResourceInUseException:
             # Table already exists
@@ -456,7 +1245,7 @@ class DynamoDBService:
             if global_secondary_indexes:
                 try:
                     # Get existing table
-                    table_description = self.client.describe_table(TableName=table_name)
+                    table_description = await self._describe_table(table_name)
                     existing_gsis = table_description.get("Table", {}).get("GlobalSecondaryIndexes", [])
                     existing_gsi_names = [gsi["IndexName"] for gsi in existing_gsis]
                     
@@ -471,19 +1260,41 @@ class DynamoDBService:
                     
                     # Update table if we have changes
                     if updates:
-                        self.client.update_table(
+                        await self._call(
+                            self.client.update_table,
                             TableName=table_name,
                             AttributeDefinitions=attribute_definitions,
                             GlobalSecondaryIndexUpdates=updates
                         )
+                        self._describe_cache.pop(table_name, None)
                 except Exception as e:
                     logger.error(f"Error updating GSIs for table {table_name}: {e}")
+                    return True
             
+            self._ensured_tables.add(table_name)
             return True
         except Exception as e:
             logger.error(f"Error creating table {table_name}: {e}")
             return False
             
+    async def _describe_table(self, table_name: str) -> Dict[str, Any]:
+        """
+        Describe table, reusing a recent result
+        
+        Args:
+            table_name: Table name
+            
+        Returns:
+            DescribeTable response
+        """
+        cached = self._describe_cache.get(table_name)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+            
+        description = await self._call(self.client.describe_table, TableName=table_name)
+        self._describe_cache[table_name] = (time.monotonic() + DESCRIBE_CACHE_TTL, description)
+        return description
+            
     async def ensure_tables_exist(self) -> bool:
         """
         Ensure required DynamoDB tables exist
@@ -491,222 +1302,19 @@ class DynamoDBService:
         Returns:
             True if all tables exist
         """
-        tables = [
-            # Agents table
-            {
-                "table_name": settings.AGENT_TABLE_NAME,
-                "key_schema": [
-                    {"AttributeName": "tenant_id", "KeyType": "HASH"},
-                    {"AttributeName": "id", "KeyType": "RANGE"}
-                ],
-                "attribute_definitions": [
-                    {"AttributeName": "tenant_id", "AttributeType": "S"},
-                    {"AttributeName": "id", "AttributeType": "S"},
-                    {"AttributeName": "status", "AttributeType": "S"},
-                    {"AttributeName": "type", "AttributeType": "S"}
-                ],
-                "provisioned_throughput": {
-                    "ReadCapacityUnits": 5,
-                    "WriteCapacityUnits": 5
-                },
-                "global_secondary_indexes": [
-                    # Index for querying agents by type
-                    {
-                        "IndexName": "TenantTypeIndex",
-                        "KeySchema": [
-                            {"AttributeName": "tenant_id", "KeyType": "HASH"},
-                            {"AttributeName": "type", "KeyType": "RANGE"}
-                        ],
-                        "Projection": {
-                            "ProjectionType": "ALL"
-                        },
-                        "ProvisionedThroughput": {
-                            "ReadCapacityUnits": 5,
-                            "WriteCapacityUnits": 5
-                        }
-                    },
-                    # Index for querying agents by status
-                    {
-                        "IndexName": "TenantStatusIndex",
-                        "KeySchema": [
-                            {"AttributeName": "tenant_id", "KeyType": "HASH"},
-                            {"AttributeName": "status", "KeyType": "RANGE"}
-                        ],
-                        "Projection": {
-                            "ProjectionType": "ALL"
-                        },
-                        "ProvisionedThroughput": {
-                            "ReadCapacityUnits": 5,
-                            "WriteCapacityUnits": 5
-                        }
-                    }
-                ]
-            },
-            # SSH keys table
-            {
-                "table_name": settings.SSH_KEY_TABLE_NAME,
-                "key_schema": [
-                    {"AttributeName": "tenant_id", "KeyType": "HASH"},
-                    {"AttributeName": "id", "KeyType": "RANGE"}
-                ],
-                "attribute_definitions": [
-                    {"AttributeName": "tenant_id", "AttributeType": "S"},
-                    {"AttributeName": "id", "AttributeType": "S"},
-                    {"AttributeName": "agent_id", "AttributeType": "S"},
-                    {"AttributeName": "key_type", "AttributeType": "S"}
-                ],
-                "provisioned_throughput": {
-                    "ReadCapacityUnits": 5,
-                    "WriteCapacityUnits": 5
-                },
-                "global_secondary_indexes": [
-                    # Index for querying keys by agent
-                    {
-                        "IndexName": "TenantAgentIndex",
-                        "KeySchema": [
-                            {"AttributeName": "tenant_id", "KeyType": "HASH"},
-                            {"AttributeName": "agent_id", "KeyType": "RANGE"}
-                        ],
-                        "Projection": {
-                            "ProjectionType": "ALL"
-                        },
-                        "ProvisionedThroughput": {
-                            "ReadCapacityUnits": 5,
-                            "WriteCapacityUnits": 5
-                        }
-                    },
-                    # Index for querying keys by type
-                    {
-                        "IndexName": "TenantKeyTypeIndex",
-                        "KeySchema": [
-                            {"AttributeName": "tenant_id", "KeyType": "HASH"},
-                            {"AttributeName": "key_type", "KeyType": "RANGE"}
-                        ],
-                        "Projection": {
-                            "ProjectionType": "ALL"
-                        },
-                        "ProvisionedThroughput": {
-                            "ReadCapacityUnits": 5,
-                            "WriteCapacityUnits": 5
-                        }
-                    }
-                ]
-            },
-            # Channels table
-            {
-                "table_name": settings.CHANNEL_TABLE_NAME,
-                "key_schema": [
-                    {"AttributeName": "tenant_id", "KeyType": "HASH"},
-                    {"AttributeName": "id", "KeyType": "RANGE"}
-                ],
-                "attribute_definitions": [
-                    {"AttributeName": "tenant_id", "AttributeType": "S"},
-                    {"AttributeName": "id", "AttributeType": "S"},
-                    {"AttributeName": "status", "AttributeType": "S"}
-                ],
-                "provisioned_throughput": {
-                    "ReadCapacityUnits": 5,
-                    "WriteCapacityUnits": 5
-                },
-                "global_secondary_indexes": [
-                    # Index for querying channels by status
-                    {
-                        "IndexName": "TenantStatusIndex",
-                        "KeySchema": [
-                            {"AttributeName": "tenant_id", "KeyType": "HASH"},
-                            {"AttributeName": "status", "KeyType": "RANGE"}
-                        ],
-                        "Projection": {
-                            "ProjectionType": "ALL"
-                        },
-                        "ProvisionedThroughput": {
-                            "ReadCapacityUnits": 5,
-                            "WriteCapacityUnits": 5
-                        }
-                    }
-                ]
-            },
-            # Tenants table
-            {
-                "table_name": settings.TENANT_TABLE_NAME,
-                "key_schema": [
-                    {"AttributeName": "id", "KeyType": "HASH"}
-                ],
-                "attribute_definitions": [
-                    {"AttributeName": "id", "AttributeType": "S"},
-                    {"AttributeName": "status", "AttributeType": "S"}
-                ],
-                "provisioned_throughput": {
-                    "ReadCapacityUnits": 5,
-                    "WriteCapacityUnits": 5
-                },
-                "global_secondary_indexes": [
-                    # Index for querying tenants by status
-                    {
-                        "IndexName": "StatusIndex",
-                        "KeySchema": [
-                            {"AttributeName": "status", "KeyType": "HASH"}
-                        ],
-                        "Projection": {
-                            "ProjectionType": "ALL"
-                        },
-                        "ProvisionedThroughput": {
-                            "ReadCapacityUnits": 5,
-                            "WriteCapacityUnits": 5
-                        }
-                    }
-                ]
-            },
-            # Usage metrics table
-            {
-                "table_name": settings.USAGE_METRICS_TABLE_NAME,
-                "key_schema": [
-                    {"AttributeName": "tenant_id", "KeyType": "HASH"},
-                    {"AttributeName": "date", "KeyType": "RANGE"}
-                ],
-                "attribute_definitions": [
-                    {"AttributeName": "tenant_id", "AttributeType": "S"},
-                    {"AttributeName": "date", "AttributeType": "S"},
-                    {"AttributeName": "metric_type", "AttributeType": "S"}
-                ],
-                "provisioned_throughput": {
-                    "ReadCapacityUnits": 5,
-                    "WriteCapacityUnits": 5
-                },
-                "global_secondary_indexes": [
-                    # Index for querying usage by metric type and tenant
-                    {
-                        "IndexName": "TenantMetricTypeIndex",
-                        "KeySchema": [
-                            {"AttributeName": "tenant_id", "KeyType": "HASH"},
-                            {"AttributeName": "metric_type", "KeyType": "RANGE"}
-                        ],
-                        "Projection": {
-                            "ProjectionType": "ALL"
-                        },
-                        "ProvisionedThroughput": {
-                            "ReadCapacityUnits": 5,
-                            "WriteCapacityUnits": 5
-                        }
-                    }
-                ]
-            }
-        ]
-        
-        # Create tables
-        success = True
-        for table in tables:
-            result = await self.create_table(
+        # Create tables concurrently; they don't depend on each other
+        results = await asyncio.gather(*[
+            self.create_table(
                 table_name=table["table_name"],
                 key_schema=table["key_schema"],
                 attribute_definitions=table["attribute_definitions"],
                 provisioned_throughput=table["provisioned_throughput"],
                 global_secondary_indexes=table.get("global_secondary_indexes")
             )
-            if not result:
-                success = False
-                
-        return success
+            for table in _TABLE_DEFINITIONS
+        ], return_exceptions=True)
+        
+        return all(result is True for result in results)
 
 
 # Singleton instance
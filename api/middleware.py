@@ -1,31 +1,31 @@
-import time
+import asyncio
+import logging
 from fastapi import Request
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.middleware.cors import CORSMiddleware
+from starlette.middleware.gzip import GZipMiddleware
 
 from config.settings import settings
 
+logger = logging.getLogger(__name__)
+
 
 class RequestLoggingMiddleware(BaseHTTPMiddleware):
     """Middleware for logging request/response information"""
     
     async def dispatch(self, request: Request, call_next):
         """Process request and log information"""
-        start_time = time.time()
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
         
         # Process request
         response = await call_next(request)
         
         # Calculate processing time
-        process_time = time.time() - start_time
-        
-        # Extract request info
-        method = request.method
-        path = request.url.path
-        status_code = response.status_code
+        process_time = loop.time() - start_time
         
         # Log request info
-        print(f"{method} {path} {status_code} {process_time:.3f}s")
+        logger.info("%s %s %s %.3fs", request.method, request.url.path, response.status_code, process_time)
         
         return response
 
@@ -41,9 +41,12 @@ def setup_middleware(app):
         allow_credentials=settings.CORS_ALLOW_CREDENTIALS,
         allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
         allow_headers=["*"],
-        expose_headers=["*"],
-        max_age=600  # Cache preflight requests for 10 minutes
+        expose_headers=settings.CORS_EXPOSE_HEADERS,
+        max_age=settings.CORS_MAX_AGE
     )
     
+    # Compress JSON payloads large enough to benefit (list endpoints)
+    app.add_middleware(GZipMiddleware, minimum_size=500)
+    
     # Request logging
     app.add_middleware(RequestLoggingMiddleware)
\ No newline at end of file
@@ -5,8 +5,7 @@ from datetime import datetime, date, timedelta
 from fastapi import APIRouter, Depends, HTTPException, Query, Path, Header, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
-from .routes import websocket_routes, subscription_routes, dashboard_websocket_routes, billing_routes, tenant_routes, agent_websocket_routes, billing_subscription_routes, profile_routes
-print("DEBUG: Importing routes...")
+from .routes import router as v1_router
 
 from artcafe_pubsub.models.agent import (
     Agent, AgentStatus, AgentType, AgentCreate, AgentUpdate, 
@@ -36,29 +35,8 @@ logger.setLevel(logging.INFO)
 # Create router
 router = APIRouter()
 
-# Include WebSocket routes
-router.include_router(websocket_routes.router, prefix="/api/v1")
-
-# Include Subscription routes
-router.include_router(subscription_routes.router, prefix="/api/v1")
-
-# Include Dashboard WebSocket routes
-router.include_router(dashboard_websocket_routes.router, prefix="/api/v1")
-
-# Include Billing routes
-router.include_router(billing_routes.router, prefix="/api/v1")
-
-# Include Tenant routes
-router.include_router(tenant_routes.router, prefix="/api/v1")
-
-# Include Agent WebSocket routes (new protocol)
-router.include_router(agent_websocket_routes.router, prefix="/api/v1")
-
-# Include Billing Subscription routes
-router.include_router(billing_subscription_routes.router, prefix="/api/v1")
-# Include Profile routes
-router.include_router(agent_routes.router, prefix="/api/v1/agents", tags=["agents"])
-router.include_router(profile_routes.router, prefix="/api/v1")
+# Include the /api/v1 routes, registered once in api/routes
+router.include_router(v1_router)
 
 # Create JWT authentication service
 jwt_auth = JWTAuth(
@@ -97,6 +75,48 @@ async def get_tenant_id(
     
     return tenant_id
 
+# Response builders shared by the single-item and list handlers
+
+def _agent_to_dict(agent: Agent) -> Dict[str, Any]:
+    """Build the response dict for an agent."""
+    last_seen = agent.last_seen
+    return {
+        "agent_id": agent.agent_id,
+        "name": agent.name,
+        "type": agent.type.value,
+        "status": agent.status.value,
+        "capabilities": [cap.dict() for cap in agent.capabilities],
+        "last_seen": last_seen.isoformat() if last_seen else None,
+        "created_at": agent.created_at.isoformat(),
+        "metadata": agent.metadata
+    }
+
+def _ssh_key_to_dict(key: SSHKey) -> Dict[str, Any]:
+    """Build the response dict for an SSH key."""
+    return {
+        "key_id": key.key_id,
+        "name": key.name,
+        "public_key": key.public_key,
+        "status": key.status.value,
+        "created_at": key.created_at.isoformat(),
+        "fingerprint": key.fingerprint,
+        "metadata": key.metadata,
+        "agent_id": key.agent_id
+    }
+
+def _channel_to_dict(channel: Channel) -> Dict[str, Any]:
+    """Build the response dict for a channel."""
+    return {
+        "id": channel.id,
+        "name": channel.name,
+        "description": channel.description,
+        "type": channel.type.value,
+        "status": channel.status.value,
+        "created_at": channel.created_at.isoformat(),
+        "metadata": channel.metadata,
+        "allowed_agents": channel.allowed_agents
+    }
+
 # AGENT ROUTES
 
 @router.post("/agents", response_model=AgentResponse, tags=["Agents"])
@@ -115,23 +135,14 @@ async def register_agent(
     token = jwt_auth.create_agent_token(agent.agent_id, tenant_id)
     
     # Return response
-    return {
-        "agent_id": agent.agent_id,
-        "name": agent.name,
-        "type": agent.type.value,
-        "status": agent.status.value,
-        "capabilities": [cap.dict() for cap in agent.capabilities],
-        "last_seen": agent.last_seen.isoformat() if agent.last_seen else None,
-        "created_at": agent.created_at.isoformat(),
-        "metadata": agent.metadata
-    }
+    return _agent_to_dict(agent)
 
 @router.get("/agents", response_model=Dict[str, Any], tags=["Agents"])
 async def list_agents(
     tenant_id: str = Depends(get_tenant_id),
     status: Optional[str] = Query(None, description="Filter by agent status"),
     type: Optional[str] = Query(None, description="Filter by agent type"),
-    limit: int = Query(50, description="Maximum number of agents to return"),
+    limit: int = Query(50, ge=1, le=1000, description="Maximum number of agents to return"),
     next_token: Optional[str] = Query(None, description="Pagination token")
 ):
     """List agents with optional filters."""
@@ -146,18 +157,7 @@ async def list_agents(
     )
     
     # Convert agents to response format
-    agents_response = []
-    for agent in result["agents"]:
-        agents_response.append({
-            "agent_id": agent.agent_id,
-            "name": agent.name,
-            "type": agent.type.value,
-            "status": agent.status.value,
-            "capabilities": [cap.dict() for cap in agent.capabilities],
-            "last_seen": agent.last_seen.isoformat() if agent.last_seen else None,
-            "created_at": agent.created_at.isoformat(),
-            "metadata": agent.metadata
-        })
+    agents_response = [_agent_to_dict(agent) for agent in result["agents"]]
     
     # Return response
     return {
@@ -178,16 +178,7 @@ async def get_agent(
         raise HTTPException(status_code=404, detail=f"Agent {agent_id} not found")
     
     # Return response
-    return {
-        "agent_id": agent.agent_id,
-        "name": agent.name,
-        "type": agent.type.value,
-        "status": agent.status.value,
-        "capabilities": [cap.dict() for cap in agent.capabilities],
-        "last_seen": agent.last_seen.isoformat() if agent.last_seen else None,
-        "created_at": agent.created_at.isoformat(),
-        "metadata": agent.metadata
-    }
+    return _agent_to_dict(agent)
 
 @router.put("/agents/{agent_id}/status", response_model=AgentResponse, tags=["Agents"])
 async def update_agent_status(
@@ -210,16 +201,7 @@ async def update_agent_status(
     agent.last_seen = datetime.utcnow()
     
     # Return updated agent
-    return {
-        "agent_id": agent.agent_id,
-        "name": agent.name,
-        "type": agent.type.value,
-        "status": agent.status.value,
-        "capabilities": [cap.dict() for cap in agent.capabilities],
-        "last_seen": agent.last_seen.isoformat() if agent.last_seen else None,
-        "created_at": agent.created_at.isoformat(),
-        "metadata": agent.metadata
-    }
+    return _agent_to_dict(agent)
 
 # SSH KEY ROUTES
 
@@ -227,7 +209,7 @@ async def update_agent_status(
 async def list_ssh_keys(
     tenant_id: str = Depends(get_tenant_id),
     agent_id: Optional[str] = Query(None, description="Filter by agent ID"),
-    limit: int = Query(50, description="Maximum number of keys to return"),
+    limit: int = Query(50, ge=1, le=1000, description="Maximum number of keys to return"),
     next_token: Optional[str] = Query(None, description="Pagination token")
 ):
     """List SSH keys with optional filters."""
@@ -241,18 +223,7 @@ async def list_ssh_keys(
     )
     
     # Convert keys to response format
-    keys_response = []
-    for key in result["ssh_keys"]:
-        keys_response.append({
-            "key_id": key.key_id,
-            "name": key.name,
-            "public_key": key.public_key,
-            "status": key.status.value,
-            "created_at": key.created_at.isoformat(),
-            "fingerprint": key.fingerprint,
-            "metadata": key.metadata,
-            "agent_id": key.agent_id
-        })
+    keys_response = [_ssh_key_to_dict(key) for key in result["ssh_keys"]]
     
     # Return response
     return {
@@ -278,16 +249,7 @@ async def add_ssh_key(
         await db_service.create_ssh_key(ssh_key)
         
         # Return response
-        return {
-            "key_id": ssh_key.key_id,
-            "name": ssh_key.name,
-            "public_key": ssh_key.public_key,
-            "status": ssh_key.status.value,
-            "created_at": ssh_key.created_at.isoformat(),
-            "fingerprint": ssh_key.fingerprint,
-            "metadata": ssh_key.metadata,
-            "agent_id": ssh_key.agent_id
-        }
+        return _ssh_key_to_dict(ssh_key)
     
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -314,7 +276,7 @@ async def list_channels(
     tenant_id: str = Depends(get_tenant_id),
     status: Optional[str] = Query(None, description="Filter by channel status"),
     type: Optional[str] = Query(None, description="Filter by channel type"),
-    limit: int = Query(50, description="Maximum number of channels to return"),
+    limit: int = Query(50, ge=1, le=1000, description="Maximum number of channels to return"),
     next_token: Optional[str] = Query(None, description="Pagination token")
 ):
     """List channels with optional filters."""
@@ -329,18 +291,7 @@ async def list_channels(
     )
     
     # Convert channels to response format
-    channels_response = []
-    for channel in result["channels"]:
-        channels_response.append({
-            "id": channel.id,
-            "name": channel.name,
-            "description": channel.description,
-            "type": channel.type.value,
-            "status": channel.status.value,
-            "created_at": channel.created_at.isoformat(),
-            "metadata": channel.metadata,
-            "allowed_agents": channel.allowed_agents
-        })
+    channels_response = [_channel_to_dict(channel) for channel in result["channels"]]
     
     # Return response
     return {
@@ -361,16 +312,7 @@ async def create_channel(
     await db_service.create_channel(channel)
     
     # Return response
-    return {
-        "id": channel.id,
-        "name": channel.name,
-        "description": channel.description,
-        "type": channel.type.value,
-        "status": channel.status.value,
-        "created_at": channel.created_at.isoformat(),
-        "metadata": channel.metadata,
-        "allowed_agents": channel.allowed_agents
-    }
+    return _channel_to_dict(channel)
 
 @router.get("/channels/{channel_id}", response_model=ChannelResponse, tags=["Channels"])
 async def get_channel(
@@ -385,16 +327,7 @@ async def get_channel(
         raise HTTPException(status_code=404, detail=f"Channel {channel_id} not found")
     
     # Return response
-    return {
-        "id": channel.id,
-        "name": channel.name,
-        "description": channel.description,
-        "type": channel.type.value,
-        "status": channel.status.value,
-        "created_at": channel.created_at.isoformat(),
-        "metadata": channel.metadata,
-        "allowed_agents": channel.allowed_agents
-    }
+    return _channel_to_dict(channel)
 
 # USAGE METRICS ROUTES
 
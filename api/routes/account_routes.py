@@ -25,9 +25,11 @@ async def list_accounts(
     from api.services.user_tenant_service import user_tenant_service
     user_tenants = await user_tenant_service.get_user_tenants(current_user["user_id"])
     
+    # Fetch all of them in one BatchGetItem rather than a GetItem per tenant
+    tenants = await tenant_service.batch_get_tenants([ut.tenant_id for ut in user_tenants])
+    
     accounts = []
-    for ut in user_tenants:
-        tenant = await tenant_service.get_tenant(ut.tenant_id)
+    for tenant in tenants:
         if tenant:
             # Map tenant to account format
             accounts.append({
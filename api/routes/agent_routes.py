@@ -25,6 +25,7 @@ class AgentCreateResponse(BaseModel):
     warning: Optional[str] = None
 
 
+from api.db.dynamodb import InvalidTokenError
 from api.services import agent_nkey_service, usage_service
 from api.services.heartbeat_service import heartbeat_service
 
@@ -35,7 +36,7 @@ router = APIRouter(prefix="/agents", tags=["agents"])
 async def list_agents(
     tenant_id: str = Depends(get_current_tenant_id),
     status: Optional[str] = Query(None, description="Filter by status"),
-    limit: int = Query(50, description="Maximum number of results"),
+    limit: int = Query(50, ge=1, le=1000, description="Maximum number of results"),
     next_token: Optional[str] = Query(None, description="Pagination token")
 ):
     """
@@ -48,21 +49,19 @@ async def list_agents(
     await usage_service.increment_api_calls(tenant_id)
     
     # Get agents from agent service
-    result = await agent_nkey_service.list_agents(
-        tenant_id=tenant_id,
-        status=status,
-        limit=limit
-    )
-    
-    # Handle response - could be a list or dict
-    if isinstance(result, list):
-        agents_list = result
-    else:
-        agents_list = result.get("agents", [])
+    try:
+        result = await agent_nkey_service.list_agents(
+            tenant_id=tenant_id,
+            status=status,
+            limit=limit,
+            next_token=next_token
+        )
+    except InvalidTokenError:
+        raise HTTPException(status_code=400, detail="Invalid next_token")
     
     # Convert Agent objects to dicts and add type field for frontend
     formatted_agents = []
-    for agent in agents_list:
+    for agent in result["agents"]:
         # Convert to dict if it's a model object
         if hasattr(agent, 'dict'):
             agent_dict = agent.dict()
@@ -85,7 +84,7 @@ async def list_agents(
     
     return AgentsResponse(
         agents=formatted_agents,
-        next_token=result.get("next_token") if isinstance(result, dict) else None
+        next_token=result["next_token"]
     )
 
 
@@ -103,7 +102,7 @@ async def get_agents_status_summary(
         
         # Get total agents from DB
         result = await agent_nkey_service.list_agents(tenant_id=tenant_id, limit=1000)
-        total_count = len(result) if isinstance(result, list) else len(result.get("agents", []))
+        total_count = len(result["agents"])
         
         return {
             "total_agents": total_count,
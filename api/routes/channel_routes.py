@@ -11,7 +11,7 @@ router = APIRouter(prefix="/channels", tags=["channels"])
 @router.get("", response_model=ChannelsResponse)
 async def list_channels(
     tenant_id: str = Depends(get_current_tenant_id),
-    limit: int = Query(50, description="Maximum number of results"),
+    limit: int = Query(50, ge=1, le=1000, description="Maximum number of results"),
     next_token: Optional[str] = Query(None, description="Pagination token")
 ):
     """
@@ -54,7 +54,7 @@ async def generate_ssh_keypair(
 @router.get("", response_model=SSHKeysResponse)
 async def list_ssh_keys(
     tenant_id: str = Depends(get_current_tenant_id),
-    limit: int = Query(50, description="Maximum number of results"),
+    limit: int = Query(50, ge=1, le=1000, description="Maximum number of results"),
     next_token: Optional[str] = Query(None, description="Pagination token")
 ):
     """
@@ -8,6 +8,7 @@ from datetime import datetime, timezone
 from boto3.dynamodb.conditions import Key
 
 from models.agent_nkey import Agent
+from api.db.dynamodb import _decode_token, _encode_token
 from config.settings import settings
 
 class AgentService:
@@ -32,21 +33,35 @@ class AgentService:
             return Agent.from_dynamodb_item(response['Item'])
         return None
     
-    async def list_agents(self, tenant_id: str, status: Optional[str] = None, limit: int = 100) -> List[Agent]:
-        """List clients for a tenant"""
-        response = self.table.query(
-            IndexName='TenantIndex',
-            KeyConditionExpression=Key('tenant_id').eq(tenant_id),
-            Limit=limit
-        )
+    async def list_agents(self, tenant_id: str, status: Optional[str] = None, limit: int = 100,
+                          next_token: Optional[str] = None) -> Dict[str, Any]:
+        """
+        List clients for a tenant, one page at a time
+        
+        Raises:
+            InvalidTokenError: next_token is malformed
+        """
+        query_kwargs = {
+            'IndexName': 'TenantIndex',
+            'KeyConditionExpression': Key('tenant_id').eq(tenant_id),
+            'Limit': limit
+        }
+        if next_token:
+            query_kwargs['ExclusiveStartKey'] = _decode_token(next_token)
+        
+        response = self.table.query(**query_kwargs)
         
         agents = []
         for item in response.get('Items', []):
             agent = Agent.from_dynamodb_item(item)
-            if not status or client.status == status:
+            if not status or agent.status == status:
                 agents.append(agent)
         
-        return agents
+        last_key = response.get('LastEvaluatedKey')
+        return {
+            'agents': agents,
+            'next_token': _encode_token(last_key) if last_key else None
+        }
     
     async def update_agent(self, agent_id: str, updates: Dict[str, Any]) -> Optional[Agent]:
         """Update client"""
@@ -47,6 +47,31 @@ class TenantService:
             logger.error(f"Error getting tenant {tenant_id}: {e}")
             raise
             
+    async def batch_get_tenants(self, tenant_ids: List[str]) -> List[Optional[Tenant]]:
+        """
+        Get several tenants by ID with BatchGetItem
+        
+        Args:
+            tenant_ids: Tenant IDs
+            
+        Returns:
+            Tenants in the order of tenant_ids, None where not found
+        """
+        try:
+            # BatchGetItem rejects duplicate keys
+            keys = [{"id": tenant_id} for tenant_id in dict.fromkeys(tenant_ids)]
+            items = await dynamodb.batch_get_items(
+                table_name=settings.TENANT_TABLE_NAME,
+                keys=keys
+            )
+            
+            # Responses come back unordered
+            tenants = {item["id"]: Tenant(**item) for item in items}
+            return [tenants.get(tenant_id) for tenant_id in tenant_ids]
+        except Exception as e:
+            logger.error(f"Error batch getting tenants: {e}")
+            raise
+            
     async def create_tenant(self, tenant_data: TenantCreate) -> Dict:
         """
         Create a new tenant
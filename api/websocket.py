@@ -277,6 +277,14 @@ class ConnectionManager:
 manager = ConnectionManager()
 
 
+async def broadcast_to_tenant(tenant_id: str, event_type: str, data: dict):
+    """Send an event to all dashboards for a tenant."""
+    await manager.broadcast_to_dashboards(tenant_id, {
+        "type": event_type,
+        "data": data
+    })
+
+
 @agent_router.websocket("/ws/agent/{agent_id}")
 async def agent_websocket(
     websocket: WebSocket,
@@ -1,5 +1,7 @@
 from typing import Optional, Dict
+import hashlib
 import logging
+import time
 from fastapi import Depends, HTTPException, Header, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 import jwt
@@ -13,6 +15,51 @@ from models.user_tenant import UserWithTenants
 # HTTP Bearer security scheme
 security = HTTPBearer()
 
+# Verified token payloads keyed by sha256(token), as (payload, expires_at).
+# Clients replay the same token on every request; opt-in via settings.TOKEN_CACHE_TTL
+_token_cache: Dict[bytes, tuple] = {}
+TOKEN_CACHE_MAX_ITEMS = 10000
+
+
+def _decode_token_cached(token: str) -> Dict:
+    """
+    Decode a JWT, reusing the payload of a recent successful decode
+    
+    Args:
+        token: JWT token
+        
+    Returns:
+        Decoded token payload
+        
+    Raises:
+        jwt.PyJWTError: If token is invalid
+    """
+    ttl = settings.TOKEN_CACHE_TTL
+    if ttl <= 0:
+        return decode_token(token)
+    
+    key = hashlib.sha256(token.encode()).digest()
+    now = time.time()
+    cached = _token_cache.pop(key, None)
+    if cached is not None and cached[1] > now:
+        _token_cache[key] = cached
+        return cached[0]
+    
+    # Raises on invalid tokens, so failures are never cached
+    payload = decode_token(token)
+    
+    # Never serve a payload past the token's own expiry
+    expires_at = now + ttl
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        expires_at = min(expires_at, exp)
+    
+    if len(_token_cache) >= TOKEN_CACHE_MAX_ITEMS:
+        # Evict the least recently used entry
+        del _token_cache[next(iter(_token_cache))]
+    _token_cache[key] = (payload, expires_at)
+    return payload
+
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
@@ -124,7 +171,7 @@ async def get_current_tenant_id(
         
     # Otherwise extract it from the JWT token
     try:
-        payload = decode_token(credentials.credentials)
+        payload = _decode_token_cached(credentials.credentials)
         logger.debug(f"JWT payload: {payload}")
         
         # Check multiple possible locations for tenant ID
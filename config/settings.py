@@ -10,11 +10,14 @@ class Settings(BaseSettings):
     APP_NAME: str = "ArtCafe PubSub Service"
     API_VERSION: str = "v1"
     DEBUG: bool = Field(default=False)
+    WORKERS: int = Field(default=0)  # Uvicorn worker processes, 0 = one per CPU
+    THREAD_POOL_SIZE: int = Field(default=0)  # anyio worker threads, 0 = 25 per CPU
     
     # JWT Settings
     JWT_SECRET_KEY: str = Field("", env="JWT_SECRET_KEY")
     JWT_ALGORITHM: str = "HS256"
     JWT_ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    TOKEN_CACHE_TTL: float = Field(default=0.0, env="TOKEN_CACHE_TTL")  # Seconds a verified token's payload is reused; opt-in, revoked tokens pass until it expires
     
     # Cognito Settings
     COGNITO_USER_POOL_ID: str = Field(default="us-east-1_YUMQS3O2J", env="COGNITO_USER_POOL_ID")
@@ -43,6 +46,11 @@ class Settings(BaseSettings):
     NATS_TLS_KEY_PATH: Optional[str] = None
     NATS_TLS_CA_PATH: Optional[str] = None
     NATS_ENABLED: bool = Field(default=False)  # Disable NATS by default
+    
+    # Optional background services
+    ENABLE_HEARTBEAT_SERVICE: bool = Field(default=True)
+    ENABLE_WILDCARD_TRACKER: bool = Field(default=True)
+    ENABLE_BACKUP_SERVICE: bool = Field(default=True)
 
     # AWS Settings
     AWS_REGION: str = Field(default="us-east-1")
@@ -55,6 +63,9 @@ class Settings(BaseSettings):
     
     # DynamoDB Settings
     DYNAMODB_ENDPOINT: Optional[str] = None
+    DYNAMODB_READ_CACHE_TTL: float = Field(default=0.0)  # Seconds get_item results are reused in-process; 0 disables
+    DYNAMODB_READ_CACHE_TABLES: List[str] = Field(default_factory=list)  # Read-mostly tables to cache; per process, no cross-worker coherence
+    DAX_ENDPOINT: Optional[str] = None  # e.g. dax://my-cluster...; reads use DAX when set (needs amazondax)
     DYNAMODB_TABLE_PREFIX: str = Field(default="artcafe-")
     AGENT_TABLE_NAME: str = Field(default="artcafe-agents")
     SSH_KEY_TABLE_NAME: str = Field(default="artcafe-ssh-keys")
@@ -65,6 +76,7 @@ class Settings(BaseSettings):
     TERMS_ACCEPTANCE_TABLE_NAME: str = Field(default="artcafe-terms-acceptance")
     USER_TENANT_TABLE_NAME: str = Field(default="artcafe-user-tenants")
     USER_TENANT_INDEX_TABLE_NAME: str = Field(default="artcafe-user-tenant-index")
+    SKIP_TABLE_CHECK: bool = Field(default=False)  # Tables are provisioned ahead of deploy
     
     # API Key settings
     API_KEY_HEADER_NAME: str = Field(default="x-api-key")
@@ -88,6 +100,8 @@ class Settings(BaseSettings):
     )
     CORS_ALLOW_CREDENTIALS: bool = Field(default=True, env="CORS_ALLOW_CREDENTIALS")
     CORS_ALLOW_ALL_ORIGINS: bool = Field(default=False, env="CORS_ALLOW_ALL_ORIGINS")
+    CORS_EXPOSE_HEADERS: List[str] = Field(default_factory=list, env="CORS_EXPOSE_HEADERS")  # Beyond the CORS-safelisted response headers
+    CORS_MAX_AGE: int = Field(default=86400, env="CORS_MAX_AGE")  # Seconds browsers may cache a preflight response
     
     class Config:
         env_file = ".env"
@@ -2,7 +2,11 @@ import os
 import json
 import uuid
 import boto3
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from datetime import datetime, date
 from typing import Dict, Any, Optional, List, Union, TypeVar, Generic, Type
@@ -15,6 +19,15 @@ logger.setLevel(logging.INFO)
 # Type variable for generic functions
 T = TypeVar('T', bound=BaseModel)
 
+# Connection pool sized for concurrent handlers; keep-alive connections are reused
+CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    connect_timeout=5,
+    read_timeout=10,
+    retries={"max_attempts": 3, "mode": "adaptive"}
+)
+
 class DynamoDBService:
     """
     Service for interacting with DynamoDB tables.
@@ -44,7 +57,14 @@ class DynamoDBService:
             region_name=region_name or os.getenv('AWS_REGION', 'us-east-1'),
             endpoint_url=endpoint_url or os.getenv('DYNAMODB_ENDPOINT'),
             aws_access_key_id=aws_access_key_id or os.getenv('AWS_ACCESS_KEY_ID'),
-            aws_secret_access_key=aws_secret_access_key or os.getenv('AWS_SECRET_ACCESS_KEY')
+            aws_secret_access_key=aws_secret_access_key or os.getenv('AWS_SECRET_ACCESS_KEY'),
+            config=CLIENT_CONFIG
+        )
+        
+        # boto3 calls block, so they run on a pool sized to the connection pool
+        self._executor = ThreadPoolExecutor(
+            max_workers=CLIENT_CONFIG.max_pool_connections,
+            thread_name_prefix="dynamodb"
         )
         
         # Table names
@@ -64,6 +84,11 @@ class DynamoDBService:
     
     # Utility functions
     
+    async def _call(self, operation, **kwargs) -> Any:
+        """Run a blocking boto3 call on the service's thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(operation, **kwargs))
+    
     def _serialize_datetime(self, obj: Any) -> Any:
         """Serialize datetime objects to ISO format string."""
         if isinstance(obj, (datetime, date)):
@@ -96,7 +121,7 @@ class DynamoDBService:
             item = self._model_to_item(agent)
             
             # Write to DynamoDB
-            self.agent_table.put_item(Item=item)
+            await self._call(self.agent_table.put_item, Item=item)
             
             logger.info(f"Created agent: {agent.agent_id}")
             return agent
@@ -119,7 +144,8 @@ class DynamoDBService:
         """
         try:
             # Get from DynamoDB
-            response = self.agent_table.get_item(
+            response = await self._call(
+                self.agent_table.get_item,
                 Key={
                     'tenant_id': tenant_id,
                     'agent_id': agent_id
@@ -198,7 +224,7 @@ class DynamoDBService:
                 params['ExclusiveStartKey'] = json.loads(next_token)
             
             # Query DynamoDB
-            response = self.agent_table.query(**params)
+            response = await self._call(self.agent_table.query, **params)
             
             # Convert items to models
             agents = [self._item_to_model(item, model_class) for item in response.get('Items', [])]
@@ -253,7 +279,8 @@ class DynamoDBService:
             update_expression = update_expression.rstrip(", ")
             
             # Update in DynamoDB
-            self.agent_table.update_item(
+            await self._call(
+                self.agent_table.update_item,
                 Key={
                     'tenant_id': tenant_id,
                     'agent_id': agent_id
@@ -284,7 +311,8 @@ class DynamoDBService:
         """
         try:
             # Update in DynamoDB
-            self.agent_table.update_item(
+            await self._call(
+                self.agent_table.update_item,
                 Key={
                     'tenant_id': tenant_id,
                     'agent_id': agent_id
@@ -319,7 +347,8 @@ class DynamoDBService:
         """
         try:
             # Delete from DynamoDB
-            self.agent_table.delete_item(
+            await self._call(
+                self.agent_table.delete_item,
                 Key={
                     'tenant_id': tenant_id,
                     'agent_id': agent_id
@@ -350,7 +379,7 @@ class DynamoDBService:
             item = self._model_to_item(ssh_key)
             
             # Write to DynamoDB
-            self.ssh_key_table.put_item(Item=item)
+            await self._call(self.ssh_key_table.put_item, Item=item)
             
             logger.info(f"Created SSH key: {ssh_key.key_id}")
             return ssh_key
@@ -403,7 +432,7 @@ class DynamoDBService:
                 params['ExclusiveStartKey'] = json.loads(next_token)
             
             # Query DynamoDB
-            response = self.ssh_key_table.query(**params)
+            response = await self._call(self.ssh_key_table.query, **params)
             
             # Convert items to models
             ssh_keys = [self._item_to_model(item, model_class) for item in response.get('Items', [])]
@@ -446,7 +475,7 @@ class DynamoDBService:
             }
             
             # Query DynamoDB
-            response = self.ssh_key_table.query(**params)
+            response = await self._call(self.ssh_key_table.query, **params)
             
             # Check if key exists
             if 'Items' not in response or len(response['Items']) == 0:
@@ -457,7 +486,8 @@ class DynamoDBService:
             key_item = response['Items'][0]
             
             # Delete from DynamoDB
-            self.ssh_key_table.delete_item(
+            await self._call(
+                self.ssh_key_table.delete_item,
                 Key={
                     'tenant_id': tenant_id,
                     'key_id': key_id
@@ -488,7 +518,7 @@ class DynamoDBService:
             item = self._model_to_item(channel)
             
             # Write to DynamoDB
-            self.channel_table.put_item(Item=item)
+            await self._call(self.channel_table.put_item, Item=item)
             
             logger.info(f"Created channel: {channel.id}")
             return channel
@@ -511,7 +541,8 @@ class DynamoDBService:
         """
         try:
             # Get from DynamoDB
-            response = self.channel_table.get_item(
+            response = await self._call(
+                self.channel_table.get_item,
                 Key={
                     'tenant_id': tenant_id,
                     'id': channel_id
@@ -590,7 +621,7 @@ class DynamoDBService:
                 params['ExclusiveStartKey'] = json.loads(next_token)
             
             # Query DynamoDB
-            response = self.channel_table.query(**params)
+            response = await self._call(self.channel_table.query, **params)
             
             # Convert items to models
             channels = [self._item_to_model(item, model_class) for item in response.get('Items', [])]
@@ -627,7 +658,7 @@ class DynamoDBService:
             item = self._model_to_item(tenant)
             
             # Write to DynamoDB
-            self.tenant_table.put_item(Item=item)
+            await self._call(self.tenant_table.put_item, Item=item)
             
             logger.info(f"Created tenant: {tenant.tenant_id}")
             return tenant
@@ -649,7 +680,8 @@ class DynamoDBService:
         """
         try:
             # Get from DynamoDB
-            response = self.tenant_table.get_item(
+            response = await self._call(
+                self.tenant_table.get_item,
                 Key={
                     'tenant_id': tenant_id
                 }
@@ -684,7 +716,7 @@ class DynamoDBService:
             item = self._model_to_item(usage_metrics)
             
             # Write to DynamoDB
-            self.usage_table.put_item(Item=item)
+            await self._call(self.usage_table.put_item, Item=item)
             
             logger.info(f"Recorded usage for tenant: {usage_metrics.tenant_id}, date: {usage_metrics.timestamp_date}")
             return usage_metrics
@@ -725,7 +757,7 @@ class DynamoDBService:
             }
             
             # Query DynamoDB
-            response = self.usage_table.query(**params)
+            response = await self._call(self.usage_table.query, **params)
             
             # Convert items to models if model_class is provided
             daily_metrics = []
@@ -26,6 +26,7 @@ class NatsConnectionManager:
         self._client: Optional[nats.NATS] = None
         self._js = None
         self._lock = asyncio.Lock()
+        self._connected = False
         
     def _get_default_options(self) -> Dict[str, Any]:
         """Get default connection options from settings"""
@@ -71,6 +72,7 @@ class NatsConnectionManager:
                     timeout=5.0
                 )
                 logger.info("Connected to NATS")
+                self._connected = True
                 
                 # Initialize JetStream
                 self._js = self._client.jetstream()
@@ -80,6 +82,7 @@ class NatsConnectionManager:
                 logger.error(f"Error connecting to NATS: {e}")
                 self._client = None
                 self._js = None
+                self._connected = False
                 raise
         
     async def get_jetstream(self):
@@ -95,6 +98,7 @@ class NatsConnectionManager:
                 await self._client.close()
                 self._client = None
                 self._js = None
+                self._connected = False
                 logger.info("NATS connection closed")
                 
     async def publish(self, subject: str, payload: dict) -> None:
@@ -119,18 +123,25 @@ class NatsConnectionManager:
             queue=queue
         )
     
+    async def flush(self, timeout: float = 1.0) -> None:
+        """Round-trip a PING to the server to confirm the connection is live"""
+        if self._client and self._client.is_connected:
+            await self._client.flush(timeout=timeout)
+    
     @property
     def is_connected(self) -> bool:
-        """Check if connected to NATS"""
-        return self._client is not None and self._client.is_connected
+        """Check if connected to NATS (kept current by the connection callbacks)"""
+        return self._connected
         
     # Callback handlers
     async def _reconnected_cb(self) -> None:
         """Called when NATS client reconnects"""
+        self._connected = True
         logger.info("Reconnected to NATS server")
         
     async def _disconnected_cb(self) -> None:
         """Called when NATS client disconnects"""
+        self._connected = False
         logger.warning("Disconnected from NATS server")
         
     async def _error_cb(self, e) -> None:
@@ -139,6 +150,7 @@ class NatsConnectionManager:
         
     async def _closed_cb(self) -> None:
         """Called when NATS client connection is closed"""
+        self._connected = False
         logger.info("NATS connection closed")
 
 
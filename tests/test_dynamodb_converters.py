@@ -0,0 +1,71 @@
+import pytest
+
+from api.db.dynamodb import (
+    _convert_from_dynamodb_item,
+    _convert_to_dynamodb_item,
+    InvalidTokenError,
+    _decode_token,
+    _encode_token,
+)
+
+
+class TestDynamoDBConverters:
+
+    def test_bool_is_stored_as_number(self):
+        # Booleans are stored as N "1"/"0", never N "True" or BOOL
+        encoded = _convert_to_dynamodb_item({"flag": True, "off": False})
+
+        assert encoded == {"flag": {"N": "1"}, "off": {"N": "0"}}
+
+    def test_bool_round_trips_as_number(self):
+        decoded = _convert_from_dynamodb_item(_convert_to_dynamodb_item({"flag": True}))
+
+        assert decoded == {"flag": 1}
+        assert decoded["flag"] == True
+
+    def test_nested_bools_are_stored_as_numbers(self):
+        encoded = _convert_to_dynamodb_item({
+            "settings": {"enabled": True},
+            "flags": [True, False],
+            "mixed": ["a", False]
+        })
+
+        assert encoded["settings"] == {"M": {"enabled": {"N": "1"}}}
+        assert encoded["flags"] == {"NS": ["1", "0"]}
+        assert encoded["mixed"] == {"L": [{"S": "a"}, {"N": "0"}]}
+
+    @pytest.mark.parametrize("value", [
+        "text",
+        42,
+        -7,
+        1.5,
+        None,
+        [],
+        ["a", "b"],
+        [1, 2.5, -3],
+        [1, "a", {"k": None}],
+        {"nested": {"deeper": ["x", 1]}}
+    ])
+    def test_round_trip(self, value):
+        assert _convert_from_dynamodb_item(_convert_to_dynamodb_item({"v": value})) == {"v": value}
+
+
+class TestPaginationTokens:
+
+    def test_token_round_trips(self):
+        key = {"id": {"S": "a/b+c"}, "created_at": {"S": "2024-01-01T00:00:00+00:00"}}
+
+        assert _decode_token(_encode_token(key)) == key
+
+    def test_token_is_url_safe(self):
+        token = _encode_token({"id": {"S": "\u00ff" * 30}})
+
+        assert all(c.isalnum() or c in "-_=" for c in token)
+
+    def test_legacy_json_token_is_accepted(self):
+        assert _decode_token('{"id": {"S": "a"}}') == {"id": {"S": "a"}}
+
+    @pytest.mark.parametrize("token", ["not-base64!", "bm90IGpzb24=", "MQ==", "{truncated"])
+    def test_malformed_token_is_rejected(self, token):
+        with pytest.raises(InvalidTokenError):
+            _decode_token(token)
@@ -0,0 +1,48 @@
+import pytest
+
+from api.db.dynamodb import DynamoDBService
+from config.settings import settings
+
+
+@pytest.fixture
+def service(monkeypatch):
+    """DynamoDBService that records the parameters of each client call"""
+    svc = DynamoDBService()
+    svc.calls = []
+
+    async def fake_call(operation, **kwargs):
+        svc.calls.append(kwargs)
+        return {}
+
+    monkeypatch.setattr(svc, "_call", fake_call)
+    return svc
+
+
+class TestPutItem:
+
+    @pytest.mark.asyncio
+    async def test_caller_supplied_fields_are_kept(self, service):
+        item = await service.put_item(settings.TENANT_TABLE_NAME, {
+            "id": "",
+            "created_at": "2020-01-01T00:00:00+00:00",
+            "updated_at": "2020-01-02T00:00:00+00:00"
+        })
+
+        assert item["id"] == ""
+        assert item["created_at"] == "2020-01-01T00:00:00+00:00"
+        assert item["updated_at"] == "2020-01-02T00:00:00+00:00"
+
+    @pytest.mark.asyncio
+    async def test_missing_fields_are_filled(self, service):
+        item = await service.put_item(settings.TENANT_TABLE_NAME, {"name": "t"})
+
+        assert item["id"]
+        assert item["created_at"] == item["updated_at"]
+
+    @pytest.mark.asyncio
+    async def test_insert_only_conditions_on_the_partition_key(self, service):
+        await service.put_item(settings.AGENT_TABLE_NAME, {"tenant_id": "t", "id": "a"}, insert_only=True)
+
+        params = service.calls[0]
+        assert params["ConditionExpression"] == "attribute_not_exists(#pk)"
+        assert params["ExpressionAttributeNames"] == {"#pk": "tenant_id"}
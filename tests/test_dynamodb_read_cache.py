@@ -0,0 +1,108 @@
+import asyncio
+import importlib
+
+import pytest
+
+from api.db.dynamodb import DynamoDBService, _convert_to_dynamodb_item
+from config.settings import settings
+
+# api.db re-exports the service singleton under the module's name
+dynamodb_module = importlib.import_module("api.db.dynamodb")
+
+TABLE = settings.TENANT_TABLE_NAME
+
+
+@pytest.fixture
+def service(monkeypatch):
+    """DynamoDBService whose reads and writes go to an in-memory table"""
+    dynamodb_module._READ_CACHE.clear()
+    dynamodb_module._WRITE_GENERATIONS.clear()
+
+    svc = DynamoDBService()
+    svc.table = {}
+    svc.reads = 0
+    svc.read_gate = None
+
+    async def fake_read(operation, TableName, Key):
+        svc.reads += 1
+        item = svc.table.get(Key["id"]["S"])
+        if svc.read_gate is not None:
+            await svc.read_gate.wait()
+        return {"Item": item} if item else {}
+
+    async def fake_call(operation, **kwargs):
+        item_id = kwargs["Key"]["id"]["S"]
+        if operation == svc.client.delete_item:
+            svc.table.pop(item_id, None)
+            return {}
+        item = dict(svc.table.get(item_id, {"id": {"S": item_id}}))
+        for placeholder, value in kwargs["ExpressionAttributeValues"].items():
+            item[placeholder[1:]] = value
+        svc.table[item_id] = item
+        return {"Attributes": item}
+
+    monkeypatch.setattr(svc, "_read", fake_read)
+    monkeypatch.setattr(svc, "_call", fake_call)
+    svc.table["t1"] = _convert_to_dynamodb_item({"id": "t1", "name": "old"})
+    return svc
+
+
+class TestReadCache:
+
+    @pytest.mark.asyncio
+    async def test_cache_is_off_by_default(self, service):
+        await service.get_item(TABLE, {"id": "t1"})
+        await service.get_item(TABLE, {"id": "t1"})
+
+        assert service.reads == 2
+
+    @pytest.mark.asyncio
+    async def test_only_allow_listed_tables_are_cached(self, service, monkeypatch):
+        monkeypatch.setattr(settings, "DYNAMODB_READ_CACHE_TTL", 5.0)
+        monkeypatch.setattr(settings, "DYNAMODB_READ_CACHE_TABLES", [])
+
+        await service.get_item(TABLE, {"id": "t1"})
+        await service.get_item(TABLE, {"id": "t1"})
+
+        assert service.reads == 2
+
+    @pytest.mark.asyncio
+    async def test_repeat_reads_are_cached_when_enabled(self, service, monkeypatch):
+        monkeypatch.setattr(settings, "DYNAMODB_READ_CACHE_TTL", 5.0)
+        monkeypatch.setattr(settings, "DYNAMODB_READ_CACHE_TABLES", [TABLE])
+
+        await service.get_item(TABLE, {"id": "t1"})
+        item = await service.get_item(TABLE, {"id": "t1"})
+
+        assert service.reads == 1
+        assert item["name"] == "old"
+
+    @pytest.mark.asyncio
+    async def test_update_during_read_is_not_overwritten(self, service, monkeypatch):
+        monkeypatch.setattr(settings, "DYNAMODB_READ_CACHE_TTL", 5.0)
+        monkeypatch.setattr(settings, "DYNAMODB_READ_CACHE_TABLES", [TABLE])
+        service.read_gate = asyncio.Event()
+
+        # The read sees the old item, then the update lands before it returns
+        read = asyncio.create_task(service.get_item(TABLE, {"id": "t1"}))
+        await asyncio.sleep(0)
+        await service.update_item(TABLE, {"id": "t1"}, {"name": "new"})
+        service.read_gate.set()
+        assert (await read)["name"] == "old"
+
+        assert (await service.get_item(TABLE, {"id": "t1"}))["name"] == "new"
+
+    @pytest.mark.asyncio
+    async def test_delete_during_read_is_not_resurrected(self, service, monkeypatch):
+        monkeypatch.setattr(settings, "DYNAMODB_READ_CACHE_TTL", 5.0)
+        monkeypatch.setattr(settings, "DYNAMODB_READ_CACHE_TABLES", [TABLE])
+        service.read_gate = asyncio.Event()
+
+        read = asyncio.create_task(service.get_item(TABLE, {"id": "t1"}))
+        await asyncio.sleep(0)
+        await service.delete_item(TABLE, {"id": "t1"})
+        service.read_gate.set()
+        await read
+
+        service.read_gate = None
+        assert await service.get_item(TABLE, {"id": "t1"}) is None
@@ -0,0 +1,50 @@
+import time
+
+import jwt
+import pytest
+
+from auth import dependencies
+from config.settings import settings
+
+
+@pytest.fixture
+def decodes(monkeypatch):
+    """Replace decode_token with a counter; tokens starting with "bad" are invalid"""
+    dependencies._token_cache.clear()
+    calls = []
+
+    def fake_decode(token):
+        calls.append(token)
+        if token.startswith("bad"):
+            raise jwt.InvalidTokenError("bad token")
+        return {"tenant_id": "t", "exp": time.time() + 3600}
+
+    monkeypatch.setattr(dependencies, "decode_token", fake_decode)
+    return calls
+
+
+class TestTokenCache:
+
+    def test_cache_is_off_by_default(self, decodes):
+        dependencies._decode_token_cached("a")
+        dependencies._decode_token_cached("a")
+
+        assert decodes == ["a", "a"]
+
+    def test_repeat_tokens_are_cached_when_enabled(self, decodes, monkeypatch):
+        monkeypatch.setattr(settings, "TOKEN_CACHE_TTL", 5.0)
+
+        dependencies._decode_token_cached("a")
+        payload = dependencies._decode_token_cached("a")
+
+        assert decodes == ["a"]
+        assert payload["tenant_id"] == "t"
+
+    def test_invalid_tokens_are_not_cached(self, decodes, monkeypatch):
+        monkeypatch.setattr(settings, "TOKEN_CACHE_TTL", 5.0)
+
+        for _ in range(2):
+            with pytest.raises(jwt.InvalidTokenError):
+                dependencies._decode_token_cached("bad")
+
+        assert decodes == ["bad", "bad"]